@@ -53,12 +53,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: LyngdorfConfigEntry) ->
         raise ConfigEntryNotReady(f'Connection failed to {model_id} @ {url}') from e
 
     # create coordinator for state management
-    coordinator = LyngdorfCoordinator(hass, client, model_id)
+    coordinator = LyngdorfCoordinator(hass, client, model_id, config_entry=entry)
 
-    # perform initial data fetch
-    await coordinator.async_config_entry_first_refresh()
-
-    # store runtime data
+    # store runtime data before platform setup so platforms can access the client
     entry.runtime_data = LyngdorfData(
         client=client,
         config=config,
@@ -68,7 +65,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: LyngdorfConfigEntry) ->
     # register listener to handle config options changes
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
-    # forward the setup to the platforms
+    # perform initial data fetch before forwarding, so a ConfigEntryNotReady retry
+    # never finds platforms left set up from the failed attempt
+    await coordinator.async_config_entry_first_refresh()
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
@@ -76,7 +75,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: LyngdorfConfigEntry) ->
 
 async def _async_update_listener(hass: HomeAssistant, entry: LyngdorfConfigEntry) -> None:
     """Handle options update."""
-    LOG.info(f'Reloading integration after reconfiguration: {entry.entry_id}')
+    LOG.info('Reloading integration after reconfiguration: %s', entry.entry_id)
     await hass.config_entries.async_reload(entry.entry_id)
 
 
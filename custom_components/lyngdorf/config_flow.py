@@ -6,6 +6,7 @@ import asyncio
 import logging
 from typing import Any
 
+import voluptuous as vol
 from homeassistant.config_entries import (
     ConfigEntry,
     ConfigFlow,
@@ -50,6 +51,53 @@ LOG = logging.getLogger(__name__)
 # supported baud rates for Lyngdorf devices
 BAUD_RATES = [9600, 19200, 38400, 57600, 115200]
 
+# options form field prefix for custom source names
+SOURCE_KEY_PREFIX = 'source_'
+
+# commonly used sources offered for custom naming in the options flow
+COMMON_SOURCES = (1, *range(3, 13), 24)
+
+# zone 2 options that are only kept while zone 2 is enabled
+ZONE2_SETTINGS = frozenset({CONF_ZONE2_DEFAULT_SOURCE, CONF_ZONE2_MAX_VOLUME})
+
+# selectors only depend on static model/source tables, so build them once
+MODEL_SELECTOR = SelectSelector(
+    SelectSelectorConfig(
+        options=[SelectOptionDict(value=model, label=model.upper()) for model in COMPATIBLE_MODELS],
+        mode=SelectSelectorMode.DROPDOWN,
+    )
+)
+BAUD_RATE_SELECTOR = SelectSelector(
+    SelectSelectorConfig(
+        options=[SelectOptionDict(value=str(rate), label=str(rate)) for rate in BAUD_RATES],
+        mode=SelectSelectorMode.DROPDOWN,
+    )
+)
+ZONE2_SOURCE_SELECTOR = SelectSelector(
+    SelectSelectorConfig(
+        options=[
+            SelectOptionDict(value=str(source_id), label=name)
+            for source_id, name in sorted(AUDIO_INPUTS.items())
+            if source_id > 0  # exclude 'None'
+        ],
+        mode=SelectSelectorMode.DROPDOWN,
+    )
+)
+TEXT_SELECTOR = TextSelector(TextSelectorConfig(type=TextSelectorType.TEXT))
+
+
+def _schema_from_selectors(
+    selectors: dict[str, Any], required_keys: tuple[str, ...] = ()
+) -> vol.Schema:
+    """Convert selector dict to voluptuous schema."""
+    schema = {}
+    for key, selector in selectors.items():
+        if key in required_keys:
+            schema[vol.Required(key)] = selector
+        else:
+            schema[vol.Optional(key)] = selector
+    return vol.Schema(schema)
+
 
 class UnsupportedDeviceError(HomeAssistantError):
     """Error for unsupported device types."""
@@ -73,7 +121,7 @@ class LyngdorfConfigFlow(ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            LOG.info(f'Config flow user input: {user_input}')
+            LOG.info('Config flow user input: %s', user_input)
 
             model_id = user_input[CONF_MODEL]
             url = user_input.get('url', '').strip()
@@ -97,66 +145,32 @@ class LyngdorfConfigFlow(ConfigFlow, domain=DOMAIN):
 
             except ConnectionError as e:
                 errors['base'] = 'cannot_connect'
-                LOG.warning(f'Failed config_flow: {errors}', exc_info=e)
+                LOG.warning('Failed config_flow: %s', errors, exc_info=e)
             except UnsupportedDeviceError as e:
                 errors['base'] = 'unsupported'
-                LOG.warning(f'Failed config_flow: {errors}', exc_info=e)
+                LOG.warning('Failed config_flow: %s', errors, exc_info=e)
             except Exception as e:
                 errors['base'] = 'cannot_connect'
-                LOG.exception(f'Unexpected error in config_flow: {e}')
+                LOG.exception('Unexpected error in config_flow: %s', e)
             else:
                 return self.async_create_entry(title='Lyngdorf', data=user_input)
 
-        # build model options for selector
-        model_options = [
-            SelectOptionDict(value=model, label=model.upper()) for model in COMPATIBLE_MODELS
-        ]
-
-        # build baud rate options
-        baud_options = [SelectOptionDict(value=str(rate), label=str(rate)) for rate in BAUD_RATES]
-
         data_schema = {
-            CONF_MODEL: SelectSelector(
-                SelectSelectorConfig(
-                    options=model_options,
-                    mode=SelectSelectorMode.DROPDOWN,
-                )
-            ),
-            'url': TextSelector(
-                TextSelectorConfig(
-                    type=TextSelectorType.TEXT,
-                )
-            ),
-            CONF_BAUD_RATE: SelectSelector(
-                SelectSelectorConfig(
-                    options=baud_options,
-                    mode=SelectSelectorMode.DROPDOWN,
-                )
-            ),
+            CONF_MODEL: MODEL_SELECTOR,
+            'url': TEXT_SELECTOR,
+            CONF_BAUD_RATE: BAUD_RATE_SELECTOR,
         }
 
         return self.async_show_form(
             step_id='user',
             data_schema=self.add_suggested_values_to_schema(
-                self._schema_from_selectors(data_schema),
+                # model and url are required, baud rate is optional
+                _schema_from_selectors(data_schema, required_keys=(CONF_MODEL, 'url')),
                 {'url': DEFAULT_URL, CONF_BAUD_RATE: '115200'},
             ),
             errors=errors,
         )
 
-    def _schema_from_selectors(self, selectors: dict[str, Any]) -> dict[str, Any]:
-        """Convert selector dict to voluptuous schema."""
-        import voluptuous as vol
-
-        schema = {}
-        for key, selector in selectors.items():
-            # model and url are required, baud rate is optional
-            if key in (CONF_MODEL, 'url'):
-                schema[vol.Required(key)] = selector
-            else:
-                schema[vol.Optional(key)] = selector
-        return vol.Schema(schema)
-
 
 class LyngdorfOptionsFlow(OptionsFlow):
     """Handle options flow for the component."""
@@ -178,7 +192,11 @@ class LyngdorfOptionsFlow(OptionsFlow):
             # convert baud rate back to int if provided
             if CONF_BAUD_RATE in user_input and user_input[CONF_BAUD_RATE]:
                 user_input[CONF_BAUD_RATE] = int(user_input[CONF_BAUD_RATE])
-            return self.async_create_entry(title='', data=user_input)
+
+            # merge with existing options, preserving other settings
+            return self.async_create_entry(
+                title='', data={**self.config_entry.options, **user_input}
+            )
 
         current_url = self.config_entry.options.get(
             'url', self.config_entry.data.get('url', DEFAULT_URL)
@@ -187,22 +205,15 @@ class LyngdorfOptionsFlow(OptionsFlow):
             CONF_BAUD_RATE, self.config_entry.data.get(CONF_BAUD_RATE, 115200)
         )
 
-        baud_options = [SelectOptionDict(value=str(rate), label=str(rate)) for rate in BAUD_RATES]
-
         data_schema = {
-            'url': TextSelector(TextSelectorConfig(type=TextSelectorType.TEXT)),
-            CONF_BAUD_RATE: SelectSelector(
-                SelectSelectorConfig(
-                    options=baud_options,
-                    mode=SelectSelectorMode.DROPDOWN,
-                )
-            ),
+            'url': TEXT_SELECTOR,
+            CONF_BAUD_RATE: BAUD_RATE_SELECTOR,
         }
 
         return self.async_show_form(
             step_id='connection',
             data_schema=self.add_suggested_values_to_schema(
-                self._schema_from_selectors(data_schema),
+                _schema_from_selectors(data_schema),
                 {'url': current_url, CONF_BAUD_RATE: str(current_baud)},
             ),
             errors=errors,
@@ -215,18 +226,18 @@ class LyngdorfOptionsFlow(OptionsFlow):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            # filter out empty source names and convert to dict
-            sources_config = {}
-            for key, value in user_input.items():
-                if value and value.strip():
-                    # extract source number from key (e.g., 'source_0' -> 0)
-                    source_id = int(key.split('_')[1])
-                    sources_config[source_id] = value.strip()
+            # filter out empty source names and convert to dict keyed by source
+            # number (e.g., 'source_0' -> 0)
+            sources_config = {
+                int(key[len(SOURCE_KEY_PREFIX) :]): name
+                for key, value in user_input.items()
+                if key.startswith(SOURCE_KEY_PREFIX) and value and (name := value.strip())
+            }
 
             # merge with existing options, preserving other settings
-            updated_options = dict(self.config_entry.options)
-            updated_options[CONF_SOURCES] = sources_config
-            return self.async_create_entry(title='', data=updated_options)
+            return self.async_create_entry(
+                title='', data={**self.config_entry.options, CONF_SOURCES: sources_config}
+            )
 
         # get current source configuration
         current_sources = self.config_entry.options.get(
@@ -234,14 +245,11 @@ class LyngdorfOptionsFlow(OptionsFlow):
         )
 
         # build schema with commonly used sources
-        common_sources = [1] + list(range(3, 13)) + [24]
-        import voluptuous as vol
-
         schema_dict = {}
-        for source_id in common_sources:
+        for source_id in COMMON_SOURCES:
             default_name = current_sources.get(source_id, AUDIO_INPUTS.get(source_id, ''))
-            schema_dict[vol.Optional(f'source_{source_id}', default=default_name)] = TextSelector(
-                TextSelectorConfig(type=TextSelectorType.TEXT)
+            schema_dict[vol.Optional(f'{SOURCE_KEY_PREFIX}{source_id}', default=default_name)] = (
+                TEXT_SELECTOR
             )
 
         return self.async_show_form(
@@ -255,25 +263,30 @@ class LyngdorfOptionsFlow(OptionsFlow):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            # merge with existing options, preserving other settings
-            updated_options = dict(self.config_entry.options)
-            updated_options[CONF_ZONE2_ENABLED] = user_input.get(
-                CONF_ZONE2_ENABLED, DEFAULT_ZONE2_ENABLED
-            )
+            zone2_enabled = user_input.get(CONF_ZONE2_ENABLED, DEFAULT_ZONE2_ENABLED)
 
-            if user_input.get(CONF_ZONE2_ENABLED):
+            # merge with existing options, preserving other settings
+            if zone2_enabled:
                 # only save zone 2 settings if enabled
+                updated_options = {
+                    **self.config_entry.options,
+                    CONF_ZONE2_ENABLED: zone2_enabled,
+                    CONF_ZONE2_MAX_VOLUME: user_input.get(
+                        CONF_ZONE2_MAX_VOLUME, DEFAULT_ZONE2_MAX_VOLUME
+                    ),
+                }
                 if user_input.get(CONF_ZONE2_DEFAULT_SOURCE) is not None:
                     updated_options[CONF_ZONE2_DEFAULT_SOURCE] = user_input[
                         CONF_ZONE2_DEFAULT_SOURCE
                     ]
-                updated_options[CONF_ZONE2_MAX_VOLUME] = user_input.get(
-                    CONF_ZONE2_MAX_VOLUME, DEFAULT_ZONE2_MAX_VOLUME
-                )
             else:
                 # remove zone 2 settings if disabled
-                updated_options.pop(CONF_ZONE2_DEFAULT_SOURCE, None)
-                updated_options.pop(CONF_ZONE2_MAX_VOLUME, None)
+                updated_options = {
+                    key: value
+                    for key, value in self.config_entry.options.items()
+                    if key not in ZONE2_SETTINGS
+                }
+                updated_options[CONF_ZONE2_ENABLED] = zone2_enabled
 
             return self.async_create_entry(title='', data=updated_options)
 
@@ -291,26 +304,12 @@ class LyngdorfOptionsFlow(OptionsFlow):
             self.config_entry.data.get(CONF_ZONE2_MAX_VOLUME, DEFAULT_ZONE2_MAX_VOLUME),
         )
 
-        # create list of source options for dropdown
-        source_options = [
-            SelectOptionDict(value=str(source_id), label=name)
-            for source_id, name in sorted(AUDIO_INPUTS.items(), key=lambda x: x[0])
-            if source_id > 0  # exclude 'None'
-        ]
-
-        import voluptuous as vol
-
         data_schema = vol.Schema(
             {
                 vol.Required(CONF_ZONE2_ENABLED, default=current_zone2_enabled): BooleanSelector(),
                 vol.Optional(
                     CONF_ZONE2_DEFAULT_SOURCE, default=current_zone2_default_source
-                ): SelectSelector(
-                    SelectSelectorConfig(
-                        options=source_options,
-                        mode=SelectSelectorMode.DROPDOWN,
-                    )
-                ),
+                ): ZONE2_SOURCE_SELECTOR,
                 vol.Optional(
                     CONF_ZONE2_MAX_VOLUME, default=current_zone2_max_volume
                 ): NumberSelector(
@@ -330,12 +329,3 @@ class LyngdorfOptionsFlow(OptionsFlow):
             data_schema=data_schema,
             errors=errors,
         )
-
-    def _schema_from_selectors(self, selectors: dict[str, Any]) -> dict[str, Any]:
-        """Convert selector dict to voluptuous schema."""
-        import voluptuous as vol
-
-        schema = {}
-        for key, selector in selectors.items():
-            schema[vol.Optional(key)] = selector
-        return vol.Schema(schema)
@@ -2,25 +2,50 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections.abc import Awaitable
 from datetime import timedelta
+from functools import cached_property
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from .const import DOMAIN
+from .pylyngdorf.exceptions import LyngdorfException
+from .pylyngdorf.models import protocol_to_db
+from .pylyngdorf.protocol import StateUpdate
 from .pylyngdorf.state import (
     AudioModeState,
     DeviceState,
-    PowerState,
     RoomPerfectState,
     SourceInfo,
     TrimSettings,
-    VolumeState,
 )
 
 LOG = logging.getLogger(__name__)
 
+# skip a poll if a push arrived within this fraction of the update interval
+PUSH_FRESH_FRACTION = 0.8
+
+# upper bound in seconds for a batch of device queries, so one stuck call can't stall a refresh
+QUERY_TIMEOUT = 5.0
+
+# state groups that only change on user action; they are cached between refreshes
+# and only re-read from the device once marked stale
+CACHED_STATE_GROUPS = ('roomperfect', 'audio_mode', 'trim', 'lipsync', 'loudness')
+
+# seconds after which cached state groups are re-read even if not marked stale
+CACHED_STATE_MAX_AGE = 300.0
+
+# seconds to wait for a burst of push notifications to settle before refreshing
+PUSH_REFRESH_COOLDOWN = 0.3
+
 
 class LyngdorfCoordinator(DataUpdateCoordinator[DeviceState]):
     """Coordinator to manage fetching Lyngdorf device data."""
@@ -31,137 +56,378 @@ class LyngdorfCoordinator(DataUpdateCoordinator[DeviceState]):
         client: Any,
         model_id: str,
         update_interval: timedelta = timedelta(seconds=30),
+        config_entry: ConfigEntry | None = None,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
             LOG,
+            config_entry=config_entry,
             name=f'Lyngdorf {model_id}',
             update_interval=update_interval,
         )
         self.client = client
         self.model_id = model_id
 
+        # cached state groups needing a re-read, see CACHED_STATE_GROUPS
+        self._stale_groups: set[str] = set(CACHED_STATE_GROUPS)
+        self._last_full_refresh = time.monotonic()
+        self._main_power_on: bool | None = None
+        self._last_push: float | None = None
+        # (main, zone 2) power seen by the last complete refresh, None forces a full one
+        self._last_power: tuple[bool, bool] | None = None
+        # fixed per device, so only queried again after the connection dropped
+        self._lipsync_range: dict[str, int] | None = None
+
         # initialize device state
-        self.data = DeviceState(
-            power=PowerState(),
-            volume_main=VolumeState(),
-            volume_zone2=VolumeState(),
+        self.data = DeviceState()
+
+        # coalesce bursts of pushes that cannot be applied in place (e.g. power
+        # transitions) into a single refresh
+        self._push_refresh_debouncer = Debouncer(
+            hass,
+            LOG,
+            cooldown=PUSH_REFRESH_COOLDOWN,
+            immediate=False,
+            function=self.async_refresh,
+        )
+
+        # register for push notifications, if the client supports them
+        self._push_enabled = hasattr(client, 'register_state_callback')
+        if self._push_enabled:
+            client.register_state_callback(self._async_on_state_update)
+
+    @cached_property
+    def model_name(self) -> str:
+        """Return the display name of the connected model."""
+        return self.client._model_config['name']
+
+    @cached_property
+    def device_info(self) -> DeviceInfo:
+        """Return device info shared by the setting and sensor entities."""
+        model_name = self.model_name
+        return DeviceInfo(
+            identifiers={(DOMAIN, f'{DOMAIN}_{self.model_id}')},
+            manufacturer='Lyngdorf',
+            model=model_name,
+            name=f'Lyngdorf {model_name}',
         )
 
-        # register protocol callbacks for push notifications
-        if hasattr(client, '_protocol'):
-            self._setup_callbacks()
+    @cached_property
+    def unique_id_prefix(self) -> str:
+        """Return the prefix of unique ids for entities of this device."""
+        return f'{DOMAIN}_{self.model_id}_'.lower()
+
+    @callback
+    def _async_on_state_update(self, state_type: str, data: StateUpdate) -> None:
+        """Handle state update pushed by the device."""
+        LOG.debug('State update callback: %s', state_type)
+        if _apply_state_update(self.data, state_type, data.groups):
+            # push payload carried the new value, no device round-trip needed
+            self._last_push = time.monotonic()
+            self.async_set_updated_data(self.data)
+        else:
+            # the next refresh must actually query the device
+            self._last_push = None
+            self._last_power = None
+            self._push_refresh_debouncer.async_schedule_call()
+
+    async def async_shutdown(self) -> None:
+        """Cancel any pending push-triggered refresh."""
+        await super().async_shutdown()
+        self._push_refresh_debouncer.async_shutdown()
+
+    @callback
+    def async_mark_stale(self, *groups: str) -> None:
+        """Mark cached state groups to be re-read from the device on next refresh."""
+        self._stale_groups.update(groups)
+
+    async def async_request_device_refresh(self) -> None:
+        """Request a refresh that re-reads the device instead of trusting pushed state.
+
+        Replies to our own commands are not dispatched as pushes, so after e.g. a
+        power on or relative volume step the local state is behind the device.
+        """
+        self._last_push = None
+        self._last_power = None
+        await self.async_request_refresh()
+
+    async def async_get_lipsync_range(self) -> dict[str, int] | None:
+        """Return the device's lipsync range, cached until the connection drops."""
+        if self._lipsync_range is None:
+            self._lipsync_range = await self.client.lipsync.get_range()
+        return self._lipsync_range
+
+    def _main_zone_queries(self, stale: set[str]) -> dict[str, Awaitable[Any]]:
+        """Return main zone queries, skipping cached groups that are still fresh."""
+        queries: dict[str, Awaitable[Any]] = {
+            'volume': self.client.volume.get(),
+            'mute': self.client.mute.get(),
+            'source': self.client.source.get(),
+        }
+        if 'roomperfect' in stale:
+            queries['rp_pos'] = self.client.roomperfect.get_position()
+            queries['rp_voi'] = self.client.roomperfect.get_voicing()
+        if 'audio_mode' in stale:
+            queries['audio_mode'] = self.client.audio_mode.get()
+        if 'trim' in stale:
+            queries['trim'] = self.client.trim.get_all()
+        if 'lipsync' in stale:
+            queries['lipsync'] = self.client.lipsync.get()
+        if 'loudness' in stale:
+            queries['loudness'] = self.client.loudness.get()
+        return queries
+
+    def _update_main_zone(
+        self, state: DeviceState, results: dict[str, Any], stale: set[str]
+    ) -> None:
+        """Apply main zone query results, carrying over cached groups."""
+        previous = self.data
+
+        volume = results['volume']
+        if volume is not None:
+            state.volume_main.level = volume
+
+        mute = results['mute']
+        if mute is not None:
+            state.volume_main.muted = mute
 
-    def _setup_callbacks(self) -> None:
-        """Set up protocol callbacks for real-time state updates."""
-        protocol = self.client._protocol
+        source_info = results['source']
+        if source_info:
+            state.source_main = SourceInfo(
+                index=int(source_info['source']),
+                name=source_info.get('name', ''),
+            )
+
+        # RoomPerfect state
+        if 'roomperfect' in stale:
+            rp_pos = results['rp_pos']
+            rp_voi = results['rp_voi']
+            if rp_pos or rp_voi:
+                state.roomperfect = RoomPerfectState()
+                if rp_pos:
+                    state.roomperfect.position = rp_pos.get('position')
+                    state.roomperfect.position_name = rp_pos.get('name')
+                if rp_voi:
+                    state.roomperfect.voicing = rp_voi.get('voicing')
+                    state.roomperfect.voicing_name = rp_voi.get('name')
+            if rp_pos is not None and rp_voi is not None:
+                self._stale_groups.discard('roomperfect')
+        else:
+            state.roomperfect = previous.roomperfect
+
+        # audio mode
+        if 'audio_mode' in stale:
+            audio_mode = results['audio_mode']
+            if audio_mode:
+                state.audio_mode = AudioModeState(
+                    mode=audio_mode.get('mode'),
+                    mode_name=audio_mode.get('name'),
+                )
+            if audio_mode is not None:
+                self._stale_groups.discard('audio_mode')
+        else:
+            state.audio_mode = previous.audio_mode
 
-        async def on_state_update(state_type: str, data: dict[str, Any]) -> None:
-            """Handle state update from device."""
-            LOG.debug(f'State update callback: {state_type}')
-            # trigger immediate refresh to update all entities
-            await self.async_request_refresh()
+        # trim settings
+        trim = results.get('trim')
+        if trim is not None:
+            state.trim = TrimSettings(**{channel: value or 0.0 for channel, value in trim.items()})
+            if None not in trim.values():
+                self._stale_groups.discard('trim')
+        else:
+            state.trim = previous.trim
 
-        protocol.register_general_callback(on_state_update)
+        if 'lipsync' in stale:
+            lipsync = results['lipsync']
+            if lipsync is not None:
+                state.lipsync = lipsync
+                self._stale_groups.discard('lipsync')
+        else:
+            state.lipsync = previous.lipsync
+
+        if 'loudness' in stale:
+            loudness = results['loudness']
+            if loudness is not None:
+                state.loudness = loudness
+                self._stale_groups.discard('loudness')
+        else:
+            state.loudness = previous.loudness
+
+    def _is_push_fresh(self) -> bool:
+        """Return True if recent pushes keep the published state current."""
+        if self._last_push is None or self._stale_groups or self.update_interval is None:
+            return False
+        max_age = self.update_interval.total_seconds() * PUSH_FRESH_FRACTION
+        return time.monotonic() - self._last_push < max_age
 
     async def _async_update_data(self) -> DeviceState:
         """Fetch data from Lyngdorf device."""
+        if self._is_push_fresh():
+            # polling is only a safety net while the device is actively pushing
+            LOG.debug('Skipping refresh, state is fresh from push updates')
+            return self.data
+
         try:
             # create new state object
-            state = DeviceState(
-                power=PowerState(),
-                volume_main=VolumeState(),
-                volume_zone2=VolumeState(),
+            state = DeviceState()
+
+            # power state decides which zones need further queries; the protocol
+            # serializes the actual sends, gather just avoids idle awaits between them
+            power, zone2_power = await asyncio.wait_for(
+                asyncio.gather(self.client.power.get(), self.client.zone_2.power.get()),
+                QUERY_TIMEOUT,
             )
 
-            # fetch main zone state
-            power = await self.client.power.get()
+            if power is not None:
+                if power and not self._main_power_on:
+                    # settings may have changed while the device was off
+                    self.async_mark_stale(*CACHED_STATE_GROUPS)
+                elif time.monotonic() - self._last_full_refresh > CACHED_STATE_MAX_AGE:
+                    # not every setting is pushed by the device, so re-read them
+                    # periodically to pick up front panel / remote changes
+                    self.async_mark_stale(*CACHED_STATE_GROUPS)
+                self._main_power_on = power
+
+            # while pushes keep volume, mute and source current, an unchanged power
+            # state with nothing stale means there is nothing left to re-read
+            power_state = (power, zone2_power)
+            if self._push_enabled and power_state == self._last_power and not self._stale_groups:
+                LOG.debug('Skipping refresh, power unchanged and no stale state')
+                return self.data
+
+            # only query other state for zones that are on, both zones in one batch
+            stale = self._stale_groups.copy()
+            queries: dict[str, Awaitable[Any]] = {}
+            if power:
+                if stale == set(CACHED_STATE_GROUPS):
+                    self._last_full_refresh = time.monotonic()
+                queries.update(self._main_zone_queries(stale))
+            if zone2_power:
+                queries['zone2_volume'] = self.client.zone_2.volume.get()
+                queries['zone2_mute'] = self.client.zone_2.mute.get()
+                queries['zone2_source'] = self.client.zone_2.source.get()
+
+            results: dict[str, Any] = {}
+            if queries:
+                values = await _gather_values(*queries.values())
+                results = dict(zip(queries, values, strict=True))
+
+            # main zone state
             if power is not None:
                 state.power.main = power
                 state.connected = True
 
                 if power:
-                    # only query other state if device is on
-                    volume = await self.client.volume.get()
-                    if volume is not None:
-                        state.volume_main.level = volume
-
-                    mute = await self.client.mute.get()
-                    if mute is not None:
-                        state.volume_main.muted = mute
-
-                    source_info = await self.client.source.get()
-                    if source_info:
-                        state.source_main = SourceInfo(
-                            index=source_info['source'],
-                            name=source_info.get('name', ''),
-                        )
-
-                    # fetch RoomPerfect state
-                    rp_pos = await self.client.roomperfect.get_position()
-                    rp_voi = await self.client.roomperfect.get_voicing()
-                    if rp_pos or rp_voi:
-                        state.roomperfect = RoomPerfectState()
-                        if rp_pos:
-                            state.roomperfect.position = rp_pos.get('position')
-                            state.roomperfect.position_name = rp_pos.get('name')
-                        if rp_voi:
-                            state.roomperfect.voicing = rp_voi.get('voicing')
-                            state.roomperfect.voicing_name = rp_voi.get('name')
-
-                    # fetch audio mode
-                    audio_mode = await self.client.audio_mode.get()
-                    if audio_mode:
-                        state.audio_mode = AudioModeState(
-                            mode=audio_mode.get('mode'),
-                            mode_name=audio_mode.get('name'),
-                        )
+                    self._update_main_zone(state, results, stale)
 
-                    # fetch trim settings
-                    trim = TrimSettings(
-                        bass=await self.client.trim.get_bass() or 0.0,
-                        treble=await self.client.trim.get_treble() or 0.0,
-                        center=await self.client.trim.get_center() or 0.0,
-                        lfe=await self.client.trim.get_lfe() or 0.0,
-                        surrounds=await self.client.trim.get_surrounds() or 0.0,
-                        height=await self.client.trim.get_height() or 0.0,
-                    )
-                    state.trim = trim
-
-                    # fetch lipsync
-                    lipsync = await self.client.lipsync.get()
-                    if lipsync is not None:
-                        state.lipsync = lipsync
-
-                    # fetch loudness
-                    loudness = await self.client.loudness.get()
-                    if loudness is not None:
-                        state.loudness = loudness
-
-            # fetch zone 2 state
-            zone2_power = await self.client.zone_2.power.get()
+            # zone 2 state
             if zone2_power is not None:
                 state.power.zone2 = zone2_power
 
                 if zone2_power:
-                    zone2_volume = await self.client.zone_2.volume.get()
+                    zone2_volume = results['zone2_volume']
                     if zone2_volume is not None:
                         state.volume_zone2.level = zone2_volume
 
-                    zone2_mute = await self.client.zone_2.mute.get()
+                    zone2_mute = results['zone2_mute']
                     if zone2_mute is not None:
                         state.volume_zone2.muted = zone2_mute
 
-                    zone2_source = await self.client.zone_2.source.get()
+                    zone2_source = results['zone2_source']
                     if zone2_source:
                         state.source_zone2 = SourceInfo(
-                            index=zone2_source['source'],
+                            index=int(zone2_source['source']),
                             name=zone2_source.get('name', ''),
                         )
 
+            # only trust this snapshot for skipping if every query succeeded
+            if None not in power_state and None not in results.values():
+                self._last_power = power_state
+            else:
+                self._last_power = None
+
             return state
 
+        except (TimeoutError, OSError, LyngdorfException) as e:
+            # expected while the device is unreachable; the coordinator logs UpdateFailed
+            # once per outage, so skip the traceback here
+            self._lipsync_range = None
+            raise UpdateFailed(f'Error communicating with device: {e}') from e
         except Exception as e:
-            LOG.exception(f'Error fetching Lyngdorf data: {e}')
+            LOG.exception('Error fetching Lyngdorf data: %s', e)
             raise UpdateFailed(f'Error communicating with device: {e}') from e
+
+
+async def _gather_values(*coros: Awaitable[Any]) -> list[Any]:
+    """Run queries concurrently, mapping individual failures and timeouts to None.
+
+    The protocol sends queries one at a time, so the deadline covers the whole batch;
+    a per-query timeout would also count the time spent queued behind the others.
+    A single failed field should not abort the whole refresh, so errors are only
+    raised when every query failed (e.g. the connection is gone).
+    """
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        _, pending = await asyncio.wait(tasks, timeout=QUERY_TIMEOUT)
+    except asyncio.CancelledError:
+        for task in tasks:
+            task.cancel()
+        raise
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.wait(pending)
+
+    results: list[Any] = []
+    for task in tasks:
+        if task.cancelled():
+            results.append(TimeoutError('Query timed out'))
+        else:
+            error = task.exception()
+            results.append(task.result() if error is None else error)
+    errors = [result for result in results if isinstance(result, Exception)]
+    if errors and len(errors) == len(results):
+        raise errors[0]
+    for error in errors:
+        LOG.debug('Ignoring failed query during refresh: %r', error)
+    return [None if isinstance(result, Exception) else result for result in results]
+
+
+def _apply_state_update(state: DeviceState, state_type: str, groups: tuple[str, ...]) -> bool:
+    """Apply a pushed state update in place.
+
+    Returns False when the update cannot be applied from the payload alone and a
+    full refresh is needed instead (power transitions change which fields are valid).
+    """
+    if state_type == 'volume':
+        state.volume_main.level = protocol_to_db(int(groups[0]))
+    elif state_type == 'volume_zone2':
+        state.volume_zone2.level = protocol_to_db(int(groups[0]))
+    elif state_type == 'mute':
+        state.volume_main.muted = groups[0] == 'ON'
+    elif state_type == 'mute_zone2':
+        state.volume_zone2.muted = groups[0] == 'ON'
+    elif state_type == 'source':
+        state.source_main = SourceInfo(index=int(groups[0]), name=groups[1])
+    elif state_type == 'source_zone2':
+        state.source_zone2 = SourceInfo(index=int(groups[0]), name=groups[1])
+    elif state_type == 'roomperfect_position':
+        if state.roomperfect is None:
+            state.roomperfect = RoomPerfectState()
+        state.roomperfect.position = int(groups[0])
+        state.roomperfect.position_name = groups[1]
+    elif state_type == 'roomperfect_voicing':
+        if state.roomperfect is None:
+            state.roomperfect = RoomPerfectState()
+        state.roomperfect.voicing = int(groups[0])
+        state.roomperfect.voicing_name = groups[1]
+    elif state_type == 'audio_mode':
+        state.audio_mode = AudioModeState(mode=int(groups[0]), mode_name=groups[1])
+    elif state_type == 'lipsync':
+        state.lipsync = int(groups[0])
+    elif state_type == 'loudness':
+        state.loudness = groups[0] == '1'
+    else:
+        return False
+    return True
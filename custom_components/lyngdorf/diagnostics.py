@@ -10,6 +10,7 @@ from homeassistant.core import HomeAssistant
 
 from . import LyngdorfConfigEntry
 from .const import CONF_SOURCES
+from .pylyngdorf.state import DeviceState
 
 # keys to redact from diagnostics
 TO_REDACT = {
@@ -19,6 +20,11 @@ TO_REDACT = {
 }
 
 
+def _as_dict(value: Any) -> dict[str, Any] | None:
+    """Convert a state dataclass to a dict, None for state that is not known yet."""
+    return asdict(value) if value is not None else None
+
+
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant,
     entry: LyngdorfConfigEntry,
@@ -27,10 +33,8 @@ async def async_get_config_entry_diagnostics(
     coordinator = entry.runtime_data.coordinator
     client = entry.runtime_data.client
 
-    # get device state as dict
-    state_dict = {}
-    if coordinator.data:
-        state_dict = asdict(coordinator.data)
+    # the coordinator is seeded with an empty state, but don't rely on it here
+    state = coordinator.data or DeviceState()
 
     # get model configuration (safe to include)
     model_config = {}
@@ -54,19 +58,19 @@ async def async_get_config_entry_diagnostics(
         'device': {
             'model_id': coordinator.model_id,
             'model_config': model_config,
-            'connected': coordinator.data.connected if coordinator.data else False,
+            'connected': state.connected,
         },
         'state': {
-            'power': state_dict.get('power', {}),
-            'volume_main': state_dict.get('volume_main', {}),
-            'volume_zone2': state_dict.get('volume_zone2', {}),
-            'source_main': state_dict.get('source_main'),
-            'source_zone2': state_dict.get('source_zone2'),
-            'roomperfect': state_dict.get('roomperfect'),
-            'audio_mode': state_dict.get('audio_mode'),
-            'trim': state_dict.get('trim'),
-            'lipsync': state_dict.get('lipsync'),
-            'loudness': state_dict.get('loudness'),
+            'power': _as_dict(state.power),
+            'volume_main': _as_dict(state.volume_main),
+            'volume_zone2': _as_dict(state.volume_zone2),
+            'source_main': _as_dict(state.source_main),
+            'source_zone2': _as_dict(state.source_zone2),
+            'roomperfect': _as_dict(state.roomperfect),
+            'audio_mode': _as_dict(state.audio_mode),
+            'trim': _as_dict(state.trim),
+            'lipsync': state.lipsync,
+            'loudness': state.loudness,
         },
         'coordinator': {
             'last_update_success': coordinator.last_update_success,
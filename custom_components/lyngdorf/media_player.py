@@ -14,6 +14,7 @@ from homeassistant.components.media_player import (
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import LyngdorfConfigEntry, LyngdorfData
 from .const import (
@@ -26,9 +27,22 @@ from .const import (
     DEFAULT_ZONE2_MAX_VOLUME,
     DOMAIN,
 )
+from .coordinator import LyngdorfCoordinator
+from .pylyngdorf.models import (
+    AUDIO_INPUTS as SOURCES,
+    AUDIO_INPUTS_NAME_TO_ID,
+    AUDIO_INPUTS_NAMES,
+    get_model_config,
+)
+from .pylyngdorf.state import SourceInfo, VolumeState
 
 LOG = logging.getLogger(__name__)
 
+MANUFACTURER = 'Lyngdorf'
+
+# sources are always keyed by the device's numeric source id, never its string form
+type SourceId = int
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -38,7 +52,12 @@ async def async_setup_entry(
     """Set up Lyngdorf media player entities."""
     data = entry.runtime_data
 
-    entities: list[LyngdorfMediaPlayer] = [LyngdorfMediaPlayer(entry, data, zone='main')]
+    # both zones derive their unique_id from the same slug
+    model_slug = entry.data[CONF_MODEL].lower().replace(' ', '_')
+
+    entities: list[LyngdorfMediaPlayer] = [
+        LyngdorfMediaPlayer(entry, data, model_slug, zone='main')
+    ]
 
     # check if zone 2 is enabled in options or data
     zone2_enabled = entry.options.get(
@@ -47,33 +66,39 @@ async def async_setup_entry(
     )
 
     if zone2_enabled:
-        entities.append(LyngdorfMediaPlayer(entry, data, zone='zone2'))
+        entities.append(LyngdorfMediaPlayer(entry, data, model_slug, zone='zone2'))
 
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities)
 
 
 @callback
 def _get_sources_from_dict(
     data: dict[str, Any],
-) -> tuple[dict[int, str], dict[str, int], list[str]]:
+) -> tuple[dict[SourceId, str], dict[str, SourceId], list[str]]:
     """Extract source mappings from config data."""
     sources_config = data[CONF_SOURCES]
     source_id_name = {int(index): name for index, name in sources_config.items()}
-    source_name_id = {v: k for k, v in source_id_name.items()}
-    source_names = sorted(source_name_id.keys(), key=lambda v: source_name_id[v])
-    return source_id_name, source_name_id, source_names
+    return _source_mappings(source_id_name)
+
+
+def _source_mappings(
+    source_id_name: dict[SourceId, str],
+) -> tuple[dict[SourceId, str], dict[str, SourceId], list[str]]:
+    """Build name lookup and source list ordered by source id."""
+    source_name_id = {name: source_id for source_id, name in sorted(source_id_name.items())}
+    return source_id_name, source_name_id, list(source_name_id)
 
 
 @callback
 def _get_sources(
     entry: LyngdorfConfigEntry,
-) -> tuple[dict[int, str], dict[str, int], list[str]]:
+) -> tuple[dict[SourceId, str], dict[str, SourceId], list[str]]:
     """Get source configuration from config entry."""
     data = entry.options if CONF_SOURCES in entry.options else entry.data
     return _get_sources_from_dict(data)
 
 
-class LyngdorfMediaPlayer(MediaPlayerEntity):
+class LyngdorfMediaPlayer(CoordinatorEntity[LyngdorfCoordinator], MediaPlayerEntity):
     """Lyngdorf media player entity."""
 
     _attr_device_class = MediaPlayerDeviceClass.RECEIVER
@@ -91,9 +116,11 @@ class LyngdorfMediaPlayer(MediaPlayerEntity):
         self,
         entry: LyngdorfConfigEntry,
         data: LyngdorfData,
+        model_slug: str,
         zone: str = 'main',
     ) -> None:
         """Initialize the media player."""
+        super().__init__(data.coordinator)
         self._entry = entry
         self._data = data
         self._client = data.client
@@ -101,29 +128,50 @@ class LyngdorfMediaPlayer(MediaPlayerEntity):
         self._zone = zone
         self._is_zone2 = zone == 'zone2'
 
+        # bind this zone's controls once instead of resolving them per call
+        zone_controls = self._client.zone_2 if self._is_zone2 else self._client
+        self._power_control = zone_controls.power
+        self._volume_control = zone_controls.volume
+        self._mute_control = zone_controls.mute
+        self._source_control = zone_controls.source
+
         # get zone 2 configuration if applicable
         if self._is_zone2:
             self._zone2_max_volume = entry.options.get(
                 CONF_ZONE2_MAX_VOLUME,
                 entry.data.get(CONF_ZONE2_MAX_VOLUME, DEFAULT_ZONE2_MAX_VOLUME),
             )
-            self._zone2_default_source = entry.options.get(
+            default_source = entry.options.get(
                 CONF_ZONE2_DEFAULT_SOURCE,
                 entry.data.get(CONF_ZONE2_DEFAULT_SOURCE),
             )
+            try:
+                self._zone2_default_source_id = (
+                    int(default_source) if default_source is not None else None
+                )
+            except (TypeError, ValueError):
+                LOG.warning('Ignoring invalid Zone 2 default source: %s', default_source)
+                self._zone2_default_source_id = None
         else:
             self._zone2_max_volume = None
-            self._zone2_default_source = None
+            self._zone2_default_source_id = None
 
         # get model configuration and sources
-        from .pylyngdorf.models import AUDIO_INPUTS as SOURCES, get_model_config
-
-        self._manufacturer = 'Lyngdorf'
         self._default_sources = SOURCES
         self._model_config = get_model_config(self._model_id)
 
+        # Lyngdorf uses dB scale, HA uses 0.0-1.0; map min_volume to 0.0 and
+        # max_volume (or the zone 2 limit, if lower) to 1.0
+        self._min_vol_db = self._model_config['min_volume'] / 10.0
+        max_vol_db = self._model_config['max_volume'] / 10.0
+        if self._zone2_max_volume is not None:
+            max_vol_db = min(max_vol_db, self._zone2_max_volume)
+        self._max_vol_db = max_vol_db
+        self._vol_range_db = max_vol_db - self._min_vol_db
+        self._inv_vol_range_db = 1.0 / self._vol_range_db
+
         zone_suffix = '_zone2' if self._is_zone2 else ''
-        self._attr_unique_id = f'{DOMAIN}_{self._model_id}{zone_suffix}'.lower().replace(' ', '_')
+        self._attr_unique_id = f'{DOMAIN}_{model_slug}{zone_suffix}'
 
         # device information
         model_name = self._model_config['name']
@@ -131,164 +179,148 @@ class LyngdorfMediaPlayer(MediaPlayerEntity):
 
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, self._attr_unique_id)},
-            manufacturer=self._manufacturer,
+            manufacturer=MANUFACTURER,
             model=model_name,
-            name=f'{self._manufacturer} {model_name}{zone_name}',
+            name=f'{MANUFACTURER} {model_name}{zone_name}',
             sw_version='Unknown',
         )
 
         # setup source list from config or use defaults
         if CONF_SOURCES in entry.data:
             source_id_name, source_name_id, source_names = _get_sources(entry)
-            self._source_id_to_name = source_id_name
-            self._source_name_to_id = source_name_id
-            self._attr_source_list = source_names
         else:
-            # use default sources
-            self._source_id_to_name = self._default_sources
-            self._source_name_to_id = {v: k for k, v in self._default_sources.items()}
-            self._attr_source_list = sorted(
-                self._source_name_to_id.keys(),
-                key=lambda v: self._source_name_to_id[v],
-            )
+            # use default sources, the lookups are shared module constants
+            source_id_name = self._default_sources
+            source_name_id = AUDIO_INPUTS_NAME_TO_ID
+            source_names = AUDIO_INPUTS_NAMES
+        self._source_id_to_name = source_id_name
+        self._source_name_to_id = source_name_id
+        self._attr_source_list = source_names
+
+    @property
+    def _power_on(self) -> bool:
+        """Return the coordinator power state of this zone."""
+        power = self.coordinator.data.power
+        return power.zone2 if self._is_zone2 else power.main
 
-    async def async_added_to_hass(self) -> None:
-        """Handle entity being added to hass."""
-        await self._initialize()
-
-    async def _initialize(self) -> None:
-        """Initialize connection dependent variables."""
-        LOG.debug(f'Connected to {self._model_id} / {self._unique_id}')
-        await self.async_update()
-
-    async def async_update(self) -> None:
-        """Retrieve the latest state."""
-        LOG.debug(f'Updating {self.unique_id}')
-
-        try:
-            # use zone2 controls if this is a zone 2 entity
-            if self._is_zone2:
-                power_control = self._client.zone2.power
-                volume_control = self._client.zone2.volume
-                mute_control = self._client.zone2.mute
-                source_control = self._client.zone2.source
-            else:
-                power_control = self._client.power
-                volume_control = self._client.volume
-                mute_control = self._client.mute
-                source_control = self._client.source
-
-            # get power state
-            power = await power_control.get()
-            if power is None:
-                LOG.warning(f'Could not get power state for {self.unique_id}')
-                return
-
-            self._attr_state = MediaPlayerState.ON if power else MediaPlayerState.OFF
-
-            # only query other state if device is on
-            if power:
-                # get volume
-                volume = await volume_control.get()
-                if volume is not None:
-                    # Lyngdorf uses dB scale, convert to 0.0-1.0
-                    # map -99.9dB to 0.0 and max_volume to 1.0
-                    min_vol = self._model_config['min_volume'] / 10.0  # convert to dB
-                    max_vol = self._model_config['max_volume'] / 10.0  # convert to dB
-
-                    # apply zone 2 max volume limit if configured
-                    if self._is_zone2 and self._zone2_max_volume is not None:
-                        max_vol = min(max_vol, self._zone2_max_volume)
-
-                    volume_range = max_vol - min_vol
-                    self._attr_volume_level = (volume - min_vol) / volume_range
-
-                # get mute state
-                mute = await mute_control.get()
-                if mute is not None:
-                    self._attr_is_volume_muted = mute
-
-                # get current source
-                source_info = await source_control.get()
-                if source_info:
-                    source_id = source_info.get('source')
-                    self._attr_source = self._source_id_to_name.get(source_id)
-
-        except Exception as e:
-            LOG.exception(f'Could not update {self.unique_id}: {e}')
+    @property
+    def _volume_state(self) -> VolumeState:
+        """Return the coordinator volume state of this zone."""
+        data = self.coordinator.data
+        return data.volume_zone2 if self._is_zone2 else data.volume_main
+
+    @property
+    def _source_info(self) -> SourceInfo | None:
+        """Return the coordinator source of this zone."""
+        data = self.coordinator.data
+        return data.source_zone2 if self._is_zone2 else data.source_main
+
+    def _set_power_on(self, on: bool) -> None:
+        """Update the coordinator power state of this zone."""
+        power = self.coordinator.data.power
+        if self._is_zone2:
+            power.zone2 = on
+        else:
+            power.main = on
+
+    def _set_source_info(self, source_info: SourceInfo) -> None:
+        """Update the coordinator source of this zone."""
+        data = self.coordinator.data
+        if self._is_zone2:
+            data.source_zone2 = source_info
+        else:
+            data.source_main = source_info
+
+    @property
+    def state(self) -> MediaPlayerState:
+        """Return the power state of this zone."""
+        return MediaPlayerState.ON if self._power_on else MediaPlayerState.OFF
+
+    @property
+    def volume_level(self) -> float:
+        """Return volume level, mapped from dB to 0.0-1.0."""
+        return (self._volume_state.level - self._min_vol_db) * self._inv_vol_range_db
+
+    @property
+    def is_volume_muted(self) -> bool:
+        """Return True if this zone is muted."""
+        return self._volume_state.muted
+
+    @property
+    def source(self) -> str | None:
+        """Return the name of the current source."""
+        if self._source_info is None:
+            return None
+        return self._source_id_to_name.get(self._source_info.index)
 
     async def async_select_source(self, source: str) -> None:
         """Select input source."""
-        if source not in self._source_name_to_id:
+        source_id = self._source_name_to_id.get(source)
+        if source_id is None:
             LOG.warning(
-                f"Selected source '{source}' not valid for {self.unique_id}, ignoring! "
-                f'Sources: {self._source_name_to_id}'
+                "Selected source '%s' not valid for %s, ignoring! Sources: %s",
+                source,
+                self.unique_id,
+                self._source_name_to_id,
             )
             return
 
-        source_id = self._source_name_to_id[source]
-        source_control = self._client.zone2.source if self._is_zone2 else self._client.source
-        await source_control.set(source_id)
-        self.async_schedule_update_ha_state(force_refresh=True)
+        await self._source_control.set(source_id)
+
+        # the target state is known, publish it without polling the device again
+        self._set_source_info(SourceInfo(index=source_id, name=source))
+        self.async_write_ha_state()
 
     async def async_turn_on(self) -> None:
         """Turn the media player on."""
-        power_control = self._client.zone2.power if self._is_zone2 else self._client.power
-        await power_control.on()
+        await self._power_control.on()
 
         # set default source for zone 2 if configured
-        if self._is_zone2 and self._zone2_default_source is not None:
+        if self._zone2_default_source_id is not None:
             try:
-                await self._client.zone2.source.set(int(self._zone2_default_source))
+                await self._source_control.set(self._zone2_default_source_id)
             except Exception as e:
-                LOG.warning(f'Could not set Zone 2 default source: {e}')
+                LOG.warning('Could not set Zone 2 default source: %s', e)
+
+        self._set_power_on(True)
+        self.async_write_ha_state()
 
-        self.async_schedule_update_ha_state(force_refresh=True)
+        # volume and source of a zone that just powered on are not known locally
+        await self.coordinator.async_request_device_refresh()
 
     async def async_turn_off(self) -> None:
         """Turn the media player off."""
-        power_control = self._client.zone2.power if self._is_zone2 else self._client.power
-        await power_control.off()
-        self.async_schedule_update_ha_state(force_refresh=True)
+        await self._power_control.off()
+        self._set_power_on(False)
+        self.async_write_ha_state()
 
     async def async_mute_volume(self, mute: bool) -> None:
         """Mute (true) or unmute (false) media player."""
-        mute_control = self._client.zone2.mute if self._is_zone2 else self._client.mute
         if mute:
-            await mute_control.on()
+            await self._mute_control.on()
         else:
-            await mute_control.off()
-        self.async_schedule_update_ha_state(force_refresh=True)
+            await self._mute_control.off()
+        self._volume_state.muted = mute
+        self.async_write_ha_state()
 
     async def async_set_volume_level(self, volume: float) -> None:
         """Set volume level, range 0-1.0."""
-        # Lyngdorf uses dB scale
-        min_vol = self._model_config['min_volume'] / 10.0  # convert to dB
-        max_vol = self._model_config['max_volume'] / 10.0  # convert to dB
-
-        # apply zone 2 max volume limit if configured
-        if self._is_zone2 and self._zone2_max_volume is not None:
-            max_vol = min(max_vol, self._zone2_max_volume)
-
-        volume_range = max_vol - min_vol
-        db_volume = min_vol + (volume * volume_range)
-        LOG.debug(f'Setting volume to {db_volume:.1f} dB (HA volume {volume})')
+        db_volume = self._min_vol_db + volume * self._vol_range_db
+        LOG.debug('Setting volume to %.1f dB (HA volume %s)', db_volume, volume)
 
-        volume_control = self._client.zone2.volume if self._is_zone2 else self._client.volume
-        await volume_control.set(db_volume)
-        self.async_schedule_update_ha_state(force_refresh=True)
+        await self._volume_control.set(db_volume)
+        self._volume_state.level = db_volume
+        self.async_write_ha_state()
 
     async def async_volume_up(self) -> None:
         """Volume up the media player."""
-        volume_control = self._client.zone2.volume if self._is_zone2 else self._client.volume
-        await volume_control.up()
-        self.async_schedule_update_ha_state(force_refresh=True)
+        await self._volume_control.up()
+        await self.coordinator.async_request_device_refresh()
 
     async def async_volume_down(self) -> None:
         """Volume down the media player."""
-        volume_control = self._client.zone2.volume if self._is_zone2 else self._client.volume
-        await volume_control.down()
-        self.async_schedule_update_ha_state(force_refresh=True)
+        await self._volume_control.down()
+        await self.coordinator.async_request_device_refresh()
 
     @property
     def icon(self) -> str | None:
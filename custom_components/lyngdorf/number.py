@@ -7,7 +7,6 @@ import logging
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.const import UnitOfSoundPressure, UnitOfTime
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -17,6 +16,16 @@ from .coordinator import LyngdorfCoordinator
 
 LOG = logging.getLogger(__name__)
 
+# trim channels with their range in dB
+TRIM_CHANNELS = (
+    ('bass', -12.0, 12.0),
+    ('treble', -12.0, 12.0),
+    ('center', -10.0, 10.0),
+    ('lfe', -10.0, 10.0),
+    ('surrounds', -10.0, 10.0),
+    ('height', -10.0, 10.0),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -27,16 +36,13 @@ async def async_setup_entry(
     coordinator = entry.runtime_data.coordinator
 
     entities: list[NumberEntity] = [
-        LyngdorfTrimBassNumber(coordinator),
-        LyngdorfTrimTrebleNumber(coordinator),
-        LyngdorfTrimCenterNumber(coordinator),
-        LyngdorfTrimLFENumber(coordinator),
-        LyngdorfTrimSurroundsNumber(coordinator),
-        LyngdorfTrimHeightNumber(coordinator),
-        LyngdorfLipsyncNumber(coordinator),
+        LyngdorfTrimNumber(coordinator, channel, min_value, max_value)
+        for channel, min_value, max_value in TRIM_CHANNELS
     ]
+    entities.append(LyngdorfLipsyncNumber(coordinator))
 
-    async_add_entities(entities, update_before_add=True)
+    # setup awaits the coordinator's first refresh before forwarding, so trim is loaded
+    async_add_entities(entities)
 
 
 class LyngdorfNumberEntity(CoordinatorEntity[LyngdorfCoordinator], NumberEntity):
@@ -52,171 +58,51 @@ class LyngdorfNumberEntity(CoordinatorEntity[LyngdorfCoordinator], NumberEntity)
     ) -> None:
         """Initialize the number entity."""
         super().__init__(coordinator)
-        self._attr_unique_id = f'{DOMAIN}_{coordinator.model_id}_{entity_type}'.lower()
-
-        model_name = coordinator.client._model_config['name']
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f'{DOMAIN}_{coordinator.model_id}')},
-            manufacturer='Lyngdorf',
-            model=model_name,
-            name=f'Lyngdorf {model_name}',
-        )
-
-
-class LyngdorfTrimBassNumber(LyngdorfNumberEntity):
-    """Number entity for bass trim control."""
-
-    _attr_translation_key = 'trim_bass'
-    _attr_native_min_value = -12.0
-    _attr_native_max_value = 12.0
-    _attr_native_step = 0.5
-    _attr_native_unit_of_measurement = UnitOfSoundPressure.DECIBEL
-
-    def __init__(self, coordinator: LyngdorfCoordinator) -> None:
-        """Initialize bass trim number."""
-        super().__init__(coordinator, 'trim_bass')
-
-    @property
-    def native_value(self) -> float | None:
-        """Return current bass trim."""
-        if self.coordinator.data.trim:
-            return self.coordinator.data.trim.bass
-        return None
-
-    async def async_set_native_value(self, value: float) -> None:
-        """Set bass trim."""
-        await self.coordinator.client.trim.set_bass(value)
-        await self.coordinator.async_request_refresh()
+        self._attr_unique_id = f'{coordinator.unique_id_prefix}{entity_type}'
+        self._attr_device_info = coordinator.device_info
 
 
-class LyngdorfTrimTrebleNumber(LyngdorfNumberEntity):
-    """Number entity for treble trim control."""
+class LyngdorfTrimNumber(LyngdorfNumberEntity):
+    """Number entity for a channel trim control."""
 
-    _attr_translation_key = 'trim_treble'
-    _attr_native_min_value = -12.0
-    _attr_native_max_value = 12.0
     _attr_native_step = 0.5
     _attr_native_unit_of_measurement = UnitOfSoundPressure.DECIBEL
 
-    def __init__(self, coordinator: LyngdorfCoordinator) -> None:
-        """Initialize treble trim number."""
-        super().__init__(coordinator, 'trim_treble')
-
-    @property
-    def native_value(self) -> float | None:
-        """Return current treble trim."""
-        if self.coordinator.data.trim:
-            return self.coordinator.data.trim.treble
-        return None
-
-    async def async_set_native_value(self, value: float) -> None:
-        """Set treble trim."""
-        await self.coordinator.client.trim.set_treble(value)
-        await self.coordinator.async_request_refresh()
-
-
-class LyngdorfTrimCenterNumber(LyngdorfNumberEntity):
-    """Number entity for center channel trim control."""
-
-    _attr_translation_key = 'trim_center'
-    _attr_native_min_value = -10.0
-    _attr_native_max_value = 10.0
-    _attr_native_step = 0.5
-    _attr_native_unit_of_measurement = UnitOfSoundPressure.DECIBEL
-
-    def __init__(self, coordinator: LyngdorfCoordinator) -> None:
-        """Initialize center trim number."""
-        super().__init__(coordinator, 'trim_center')
-
-    @property
-    def native_value(self) -> float | None:
-        """Return current center trim."""
-        if self.coordinator.data.trim:
-            return self.coordinator.data.trim.center
-        return None
-
-    async def async_set_native_value(self, value: float) -> None:
-        """Set center trim."""
-        await self.coordinator.client.trim.set_center(value)
-        await self.coordinator.async_request_refresh()
-
-
-class LyngdorfTrimLFENumber(LyngdorfNumberEntity):
-    """Number entity for LFE channel trim control."""
-
-    _attr_translation_key = 'trim_lfe'
-    _attr_native_min_value = -10.0
-    _attr_native_max_value = 10.0
-    _attr_native_step = 0.5
-    _attr_native_unit_of_measurement = UnitOfSoundPressure.DECIBEL
-
-    def __init__(self, coordinator: LyngdorfCoordinator) -> None:
-        """Initialize LFE trim number."""
-        super().__init__(coordinator, 'trim_lfe')
-
-    @property
-    def native_value(self) -> float | None:
-        """Return current LFE trim."""
-        if self.coordinator.data.trim:
-            return self.coordinator.data.trim.lfe
-        return None
-
-    async def async_set_native_value(self, value: float) -> None:
-        """Set LFE trim."""
-        await self.coordinator.client.trim.set_lfe(value)
-        await self.coordinator.async_request_refresh()
-
-
-class LyngdorfTrimSurroundsNumber(LyngdorfNumberEntity):
-    """Number entity for surround channels trim control."""
-
-    _attr_translation_key = 'trim_surrounds'
-    _attr_native_min_value = -10.0
-    _attr_native_max_value = 10.0
-    _attr_native_step = 0.5
-    _attr_native_unit_of_measurement = UnitOfSoundPressure.DECIBEL
-
-    def __init__(self, coordinator: LyngdorfCoordinator) -> None:
-        """Initialize surrounds trim number."""
-        super().__init__(coordinator, 'trim_surrounds')
-
-    @property
-    def native_value(self) -> float | None:
-        """Return current surrounds trim."""
-        if self.coordinator.data.trim:
-            return self.coordinator.data.trim.surrounds
-        return None
-
-    async def async_set_native_value(self, value: float) -> None:
-        """Set surrounds trim."""
-        await self.coordinator.client.trim.set_surrounds(value)
-        await self.coordinator.async_request_refresh()
-
-
-class LyngdorfTrimHeightNumber(LyngdorfNumberEntity):
-    """Number entity for height channels trim control."""
-
-    _attr_translation_key = 'trim_height'
-    _attr_native_min_value = -10.0
-    _attr_native_max_value = 10.0
-    _attr_native_step = 0.5
-    _attr_native_unit_of_measurement = UnitOfSoundPressure.DECIBEL
-
-    def __init__(self, coordinator: LyngdorfCoordinator) -> None:
-        """Initialize height trim number."""
-        super().__init__(coordinator, 'trim_height')
+    def __init__(
+        self,
+        coordinator: LyngdorfCoordinator,
+        channel: str,
+        min_value: float,
+        max_value: float,
+    ) -> None:
+        """Initialize trim number for a channel."""
+        super().__init__(coordinator, f'trim_{channel}')
+        self._attr_translation_key = f'trim_{channel}'
+        self._attr_native_min_value = min_value
+        self._attr_native_max_value = max_value
+        self._channel = channel
+        self._setter = getattr(coordinator.client.trim, f'set_{channel}')
 
     @property
     def native_value(self) -> float | None:
-        """Return current height trim."""
-        if self.coordinator.data.trim:
-            return self.coordinator.data.trim.height
-        return None
+        """Return current trim of this entity's channel."""
+        if (trim := self.coordinator.data.trim) is None:
+            return None
+        return getattr(trim, self._channel)
 
     async def async_set_native_value(self, value: float) -> None:
-        """Set height trim."""
-        await self.coordinator.client.trim.set_height(value)
-        await self.coordinator.async_request_refresh()
+        """Set trim of this entity's channel."""
+        await self._setter(value)
+
+        # publish the new value right away; slider drags fire many sets in a row,
+        # so the confirming refresh must not hold up the next one
+        if (trim := self.coordinator.data.trim) is not None:
+            setattr(trim, self._channel, value)
+            self.async_write_ha_state()
+        self.coordinator.async_mark_stale('trim')
+        self.hass.async_create_background_task(
+            self.coordinator.async_request_refresh(), f'{DOMAIN} trim refresh'
+        )
 
 
 class LyngdorfLipsyncNumber(LyngdorfNumberEntity):
@@ -231,17 +117,18 @@ class LyngdorfLipsyncNumber(LyngdorfNumberEntity):
     def __init__(self, coordinator: LyngdorfCoordinator) -> None:
         """Initialize lipsync number."""
         super().__init__(coordinator, 'lipsync')
+        self._setter = coordinator.client.lipsync.set
 
     async def async_added_to_hass(self) -> None:
         """Query device for lipsync range."""
         await super().async_added_to_hass()
         try:
-            range_info = await self.coordinator.client.lipsync.get_range()
+            range_info = await self.coordinator.async_get_lipsync_range()
             if range_info:
                 self._attr_native_min_value = range_info['min']
                 self._attr_native_max_value = range_info['max']
         except Exception as e:
-            LOG.warning(f'Could not get lipsync range: {e}')
+            LOG.warning('Could not get lipsync range: %s', e)
 
     @property
     def native_value(self) -> float | None:
@@ -250,5 +137,12 @@ class LyngdorfLipsyncNumber(LyngdorfNumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Set lipsync delay."""
-        await self.coordinator.client.lipsync.set(int(value))
-        await self.coordinator.async_request_refresh()
+        await self._setter(int(value))
+
+        # same as trim: publish right away, confirm in the background
+        self.coordinator.data.lipsync = int(value)
+        self.async_write_ha_state()
+        self.coordinator.async_mark_stale('lipsync')
+        self.hass.async_create_background_task(
+            self.coordinator.async_request_refresh(), f'{DOMAIN} lipsync refresh'
+        )
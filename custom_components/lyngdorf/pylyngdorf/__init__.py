@@ -2,30 +2,111 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import re
+import time
+from functools import lru_cache, partial
 from threading import RLock
 from typing import Any
 
-import serial
-
 from .models import (
     COMMAND_EOL,
     RESPONSE_EOL,
+    RESPONSE_EOL_BYTES,
     SUPPORTED_MODELS,
     db_to_protocol,
     get_model_config,
     protocol_to_db,
 )
-from .protocol import async_get_protocol
+from .protocol import async_get_protocol, enable_tcp_nodelay
 
 __version__ = '0.1.0'
 
 LOG = logging.getLogger(__name__)
 
+# trim range per channel in protocol units (0.1 dB)
+TRIM_LIMITS = {
+    'BASS': (-120, 120),
+    'TREB': (-120, 120),
+    'CENTER': (-100, 100),
+    'LFE': (-100, 100),
+    'SURRS': (-100, 100),
+    'HEIGHT': (-100, 100),
+}
+
+# seconds a sync client reuses the reply to a repeated query
+RESPONSE_CACHE_TTL = 0.2
+
+# queries whose replies only change through our own commands; seconds an async client
+# reuses the reply, None for the lifetime of the connection
+STATIC_QUERY_TTL: dict[str, float | None] = {
+    '!DEVICE?': None,
+    '!INTERFACE?': None,
+    '!SRCS?': None,
+    '!ZSRCS?': None,
+    '!RPFOCS?': None,
+    '!RPVOIS?': None,
+    '!AUDMODEL?': None,
+    '!LIPSYNCRANGE?': None,
+    '!MAXVOL?': 30.0,
+    '!DEFVOL?': 30.0,
+}
+
+
+@lru_cache(maxsize=512)
+def _encode_command(command: str) -> bytes:
+    """Return the wire form of a command; most commands are fixed strings, so cache them."""
+    return (command + COMMAND_EOL).encode('ascii')
+
+
+# status responses look like '!TAG(value)', optionally followed by a quoted name
+_RESPONSE_RE = re.compile(r'!(?P<tag>[A-Z0-9]+)\((?P<value>[^)]*)\)(?:"(?P<name>[^"]*)")?')
+
+
+def _match_response(response: str | None, tag: str) -> re.Match[str] | None:
+    """Return the match of a '!TAG(...)' response, None if it is another reply."""
+    if response:
+        match = _RESPONSE_RE.search(response)
+        if match is not None and match['tag'] == tag:
+            return match
+    return None
+
+
+def _parse_value(response: str | None, tag: str) -> str | None:
+    """Return the value of a '!TAG(value)' response."""
+    if (match := _match_response(response, tag)) is not None:
+        return match['value']
+    return None
+
+
+def _parse_named(response: str | None, tag: str) -> tuple[int, str] | None:
+    """Return index and name of a '!TAG(index)"name"' response."""
+    if (match := _match_response(response, tag)) is not None:
+        try:
+            return int(match['value']), match['name'] or ''
+        except ValueError:
+            return None
+    return None
+
+
+def _parse_named_list(response: str, tag: str) -> dict[int, str]:
+    """Return index to name of every '!TAG(index)"name"' line in a listing response."""
+    items = {}
+    for match in _RESPONSE_RE.finditer(response):
+        if match['tag'] == tag and match['name'] is not None:
+            try:
+                items[int(match['value'])] = match['name']
+            except ValueError:
+                continue
+    return items
+
 
 class PowerControl:
     """Power control interface."""
 
+    __slots__ = ('_client',)
+
     def __init__(self, client):
         self._client = client
 
@@ -40,8 +121,7 @@ class PowerControl:
     def get(self) -> bool | None:
         """Get power status (True=on, False=off)."""
         response = self._client._send_command('!POWER?')
-        if response and '!POWER(' in response:
-            state = response.split('(')[1].split(')')[0]
+        if (state := _parse_value(response, 'POWER')) is not None:
             return state == '1'
         return None
 
@@ -49,8 +129,13 @@ class PowerControl:
 class VolumeControl:
     """Volume control interface."""
 
+    __slots__ = ('_client', '_min_volume', '_max_volume')
+
     def __init__(self, client):
         self._client = client
+        # the model never changes, so read its volume range once
+        self._min_volume = client._model_config['min_volume']
+        self._max_volume = client._model_config['max_volume']
 
     def set(self, db: float):
         """
@@ -59,10 +144,7 @@ class VolumeControl:
         Args:
             db: Volume in dB (-99.9 to +20.0 for MP-50, -99.9 to +24.0 for MP-60)
         """
-        value = db_to_protocol(db)
-        min_vol = self._client._model_config['min_volume']
-        max_vol = self._client._model_config['max_volume']
-        value = max(min_vol, min(max_vol, value))
+        value = max(self._min_volume, min(self._max_volume, db_to_protocol(db)))
         return self._client._send_command(f'!VOL({value})')
 
     def up(self, amount: float | None = None):
@@ -92,16 +174,14 @@ class VolumeControl:
     def get(self) -> float | None:
         """Get current volume level in dB."""
         response = self._client._send_command('!VOL?')
-        if response and '!VOL(' in response:
-            vol = response.split('(')[1].split(')')[0]
+        if (vol := _parse_value(response, 'VOL')) is not None:
             return protocol_to_db(int(vol))
         return None
 
     def get_max(self) -> float | None:
         """Get maximum volume setting in dB."""
         response = self._client._send_command('!MAXVOL?')
-        if response and '!MAXVOL(' in response:
-            max_vol = response.split('(')[1].split(')')[0]
+        if (max_vol := _parse_value(response, 'MAXVOL')) is not None:
             return protocol_to_db(int(max_vol))
         return None
 
@@ -113,8 +193,7 @@ class VolumeControl:
     def get_default(self) -> float | None:
         """Get default volume setting in dB."""
         response = self._client._send_command('!DEFVOL?')
-        if response and '!DEFVOL(' in response:
-            defvol = response.split('(')[1].split(')')[0]
+        if (defvol := _parse_value(response, 'DEFVOL')) is not None:
             return protocol_to_db(int(defvol))
         return None
 
@@ -129,6 +208,8 @@ class VolumeControl:
 class MuteControl:
     """Mute control interface."""
 
+    __slots__ = ('_client',)
+
     def __init__(self, client):
         self._client = client
 
@@ -155,9 +236,11 @@ class MuteControl:
 class SourceControl:
     """Source/input control interface."""
 
+    __slots__ = ('_client', '_sources')
+
     def __init__(self, client):
         self._client = client
-        self._sources = {}  # will be populated by discover()
+        self._sources: dict[int, str] | None = None  # populated by discover()
 
     def discover(self) -> dict[int, str]:
         """
@@ -170,16 +253,7 @@ class SourceControl:
         if not response:
             return {}
 
-        sources = {}
-        lines = response.split('\r')
-        for line in lines:
-            if '!SRC(' in line and ')' in line and '"' in line:
-                try:
-                    idx = int(line.split('(')[1].split(')')[0])
-                    name = line.split('"')[1]
-                    sources[idx] = name
-                except (ValueError, IndexError):
-                    continue
+        sources = _parse_named_list(response, 'SRC')
 
         self._sources = sources
         return sources
@@ -191,14 +265,9 @@ class SourceControl:
     def get(self) -> dict[str, Any] | None:
         """Get current source info."""
         response = self._client._send_command('!SRC?')
-        if response and '!SRC(' in response:
-            try:
-                parts = response.split('(')[1].split(')')
-                source_num = int(parts[0])
-                name = response.split('"')[1] if '"' in response else ''
-                return {'source': source_num, 'name': name}
-            except (ValueError, IndexError):
-                return None
+        if (parsed := _parse_named(response, 'SRC')) is not None:
+            source_num, name = parsed
+            return {'source': source_num, 'name': name}
         return None
 
     def next(self):
@@ -212,21 +281,15 @@ class SourceControl:
     def info(self, source: int) -> dict[str, Any] | None:
         """Get info for specific source."""
         response = self._client._send_command(f'!SRC({source})?')
-        if response and '!SRC(' in response:
-            try:
-                parts = response.split('(')[1].split(')')
-                source_num = int(parts[0])
-                name = response.split('"')[1] if '"' in response else ''
-                return {'source': source_num, 'name': name}
-            except (ValueError, IndexError):
-                return None
+        if (parsed := _parse_named(response, 'SRC')) is not None:
+            source_num, name = parsed
+            return {'source': source_num, 'name': name}
         return None
 
     def get_offset(self) -> float | None:
         """Get source volume offset for current source in dB."""
         response = self._client._send_command('!SRCOFF?')
-        if response and '!SRCOFF(' in response:
-            offset = response.split('(')[1].split(')')[0]
+        if (offset := _parse_value(response, 'SRCOFF')) is not None:
             return protocol_to_db(int(offset))
         return None
 
@@ -240,10 +303,13 @@ class SourceControl:
 class RoomPerfectControl:
     """RoomPerfect focus position and voicing control."""
 
+    __slots__ = ('_client', '_positions', '_voicings')
+
     def __init__(self, client):
         self._client = client
-        self._positions = {}
-        self._voicings = {}
+        # populated by discover_positions() / discover_voicings()
+        self._positions: dict[int, str] | None = None
+        self._voicings: dict[int, str] | None = None
 
     def discover_positions(self) -> dict[int, str]:
         """Discover available RoomPerfect focus positions."""
@@ -251,16 +317,7 @@ class RoomPerfectControl:
         if not response:
             return {}
 
-        positions = {}
-        lines = response.split('\r')
-        for line in lines:
-            if '!RPFOC(' in line and ')' in line and '"' in line:
-                try:
-                    idx = int(line.split('(')[1].split(')')[0])
-                    name = line.split('"')[1]
-                    positions[idx] = name
-                except (ValueError, IndexError):
-                    continue
+        positions = _parse_named_list(response, 'RPFOC')
 
         self._positions = positions
         return positions
@@ -268,14 +325,9 @@ class RoomPerfectControl:
     def get_position(self) -> dict[str, Any] | None:
         """Get current RoomPerfect position."""
         response = self._client._send_command('!RPFOC?')
-        if response and '!RPFOC(' in response:
-            try:
-                parts = response.split('(')[1].split(')')
-                pos_num = int(parts[0])
-                name = response.split('"')[1] if '"' in response else ''
-                return {'position': pos_num, 'name': name}
-            except (ValueError, IndexError):
-                return None
+        if (parsed := _parse_named(response, 'RPFOC')) is not None:
+            pos_num, name = parsed
+            return {'position': pos_num, 'name': name}
         return None
 
     def set_position(self, position: int):
@@ -296,16 +348,7 @@ class RoomPerfectControl:
         if not response:
             return {}
 
-        voicings = {}
-        lines = response.split('\r')
-        for line in lines:
-            if '!RPVOI(' in line and ')' in line and '"' in line:
-                try:
-                    idx = int(line.split('(')[1].split(')')[0])
-                    name = line.split('"')[1]
-                    voicings[idx] = name
-                except (ValueError, IndexError):
-                    continue
+        voicings = _parse_named_list(response, 'RPVOI')
 
         self._voicings = voicings
         return voicings
@@ -313,14 +356,9 @@ class RoomPerfectControl:
     def get_voicing(self) -> dict[str, Any] | None:
         """Get current voicing."""
         response = self._client._send_command('!RPVOI?')
-        if response and '!RPVOI(' in response:
-            try:
-                parts = response.split('(')[1].split(')')
-                voi_num = int(parts[0])
-                name = response.split('"')[1] if '"' in response else ''
-                return {'voicing': voi_num, 'name': name}
-            except (ValueError, IndexError):
-                return None
+        if (parsed := _parse_named(response, 'RPVOI')) is not None:
+            voi_num, name = parsed
+            return {'voicing': voi_num, 'name': name}
         return None
 
     def set_voicing(self, voicing: int):
@@ -339,9 +377,11 @@ class RoomPerfectControl:
 class AudioModeControl:
     """Audio processing mode control."""
 
+    __slots__ = ('_client', '_modes')
+
     def __init__(self, client):
         self._client = client
-        self._modes = {}
+        self._modes: dict[int, str] | None = None  # populated by discover()
 
     def discover(self) -> dict[int, str]:
         """Discover available audio processing modes."""
@@ -349,16 +389,7 @@ class AudioModeControl:
         if not response:
             return {}
 
-        modes = {}
-        lines = response.split('\r')
-        for line in lines:
-            if '!AUDMODE(' in line and ')' in line and '"' in line:
-                try:
-                    idx = int(line.split('(')[1].split(')')[0])
-                    name = line.split('"')[1]
-                    modes[idx] = name
-                except (ValueError, IndexError):
-                    continue
+        modes = _parse_named_list(response, 'AUDMODE')
 
         self._modes = modes
         return modes
@@ -366,14 +397,9 @@ class AudioModeControl:
     def get(self) -> dict[str, Any] | None:
         """Get current audio mode."""
         response = self._client._send_command('!AUDMODE?')
-        if response and '!AUDMODE(' in response:
-            try:
-                parts = response.split('(')[1].split(')')
-                mode_num = int(parts[0])
-                name = response.split('"')[1] if '"' in response else ''
-                return {'mode': mode_num, 'name': name}
-            except (ValueError, IndexError):
-                return None
+        if (parsed := _parse_named(response, 'AUDMODE')) is not None:
+            mode_num, name = parsed
+            return {'mode': mode_num, 'name': name}
         return None
 
     def set(self, mode: int):
@@ -392,21 +418,22 @@ class AudioModeControl:
 class TrimControl:
     """Channel trim level controls."""
 
+    __slots__ = ('_client',)
+
     def __init__(self, client):
         self._client = client
 
     def _get_trim(self, channel: str) -> float | None:
         """Get trim level for a channel in dB."""
         response = self._client._send_command(f'!TRIM{channel}?')
-        if response and f'!TRIM{channel}(' in response:
-            trim = response.split('(')[1].split(')')[0]
+        if (trim := _parse_value(response, f'TRIM{channel}')) is not None:
             return protocol_to_db(int(trim))
         return None
 
-    def _set_trim(self, channel: str, db: float, min_db: float, max_db: float):
-        """Set trim level for a channel in dB."""
-        value = db_to_protocol(db)
-        value = max(int(min_db * 10), min(int(max_db * 10), value))
+    def _set_trim(self, channel: str, db: float):
+        """Set trim level for a channel in dB, clamped to the channel's range."""
+        min_value, max_value = TRIM_LIMITS[channel]
+        value = max(min_value, min(max_value, db_to_protocol(db)))
         return self._client._send_command(f'!TRIM{channel}({value})')
 
     def get_bass(self) -> float | None:
@@ -415,7 +442,7 @@ class TrimControl:
 
     def set_bass(self, db: float):
         """Set bass trim in dB (-12.0 to +12.0)."""
-        return self._set_trim('BASS', db, -12.0, 12.0)
+        return self._set_trim('BASS', db)
 
     def get_treble(self) -> float | None:
         """Get treble trim in dB."""
@@ -423,7 +450,7 @@ class TrimControl:
 
     def set_treble(self, db: float):
         """Set treble trim in dB (-12.0 to +12.0)."""
-        return self._set_trim('TREB', db, -12.0, 12.0)
+        return self._set_trim('TREB', db)
 
     def get_center(self) -> float | None:
         """Get center channel trim in dB."""
@@ -431,7 +458,7 @@ class TrimControl:
 
     def set_center(self, db: float):
         """Set center channel trim in dB (-10.0 to +10.0)."""
-        return self._set_trim('CENTER', db, -10.0, 10.0)
+        return self._set_trim('CENTER', db)
 
     def get_lfe(self) -> float | None:
         """Get LFE channel trim in dB."""
@@ -439,7 +466,7 @@ class TrimControl:
 
     def set_lfe(self, db: float):
         """Set LFE channel trim in dB (-10.0 to +10.0)."""
-        return self._set_trim('LFE', db, -10.0, 10.0)
+        return self._set_trim('LFE', db)
 
     def get_surrounds(self) -> float | None:
         """Get surround channels trim in dB."""
@@ -447,7 +474,7 @@ class TrimControl:
 
     def set_surrounds(self, db: float):
         """Set surround channels trim in dB (-10.0 to +10.0)."""
-        return self._set_trim('SURRS', db, -10.0, 10.0)
+        return self._set_trim('SURRS', db)
 
     def get_height(self) -> float | None:
         """Get height channels trim in dB."""
@@ -455,20 +482,32 @@ class TrimControl:
 
     def set_height(self, db: float):
         """Set height channels trim in dB (-10.0 to +10.0)."""
-        return self._set_trim('HEIGHT', db, -10.0, 10.0)
+        return self._set_trim('HEIGHT', db)
+
+    def get_all(self) -> dict[str, float | None]:
+        """Get all channel trims in dB, keyed by channel (bass, treble, ...)."""
+        return {
+            'bass': self.get_bass(),
+            'treble': self.get_treble(),
+            'center': self.get_center(),
+            'lfe': self.get_lfe(),
+            'surrounds': self.get_surrounds(),
+            'height': self.get_height(),
+        }
 
 
 class LipsyncControl:
     """Lipsync delay control."""
 
+    __slots__ = ('_client',)
+
     def __init__(self, client):
         self._client = client
 
     def get(self) -> int | None:
         """Get lipsync delay in milliseconds."""
         response = self._client._send_command('!LIPSYNC?')
-        if response and '!LIPSYNC(' in response:
-            delay = response.split('(')[1].split(')')[0]
+        if (delay := _parse_value(response, 'LIPSYNC')) is not None:
             return int(delay)
         return None
 
@@ -487,11 +526,11 @@ class LipsyncControl:
     def get_range(self) -> dict[str, int] | None:
         """Get valid lipsync range."""
         response = self._client._send_command('!LIPSYNCRANGE?')
-        if response and '!LIPSYNCRANGE(' in response:
+        if (values := _parse_value(response, 'LIPSYNCRANGE')) is not None:
             try:
-                values = response.split('(')[1].split(')')[0].split(',')
-                return {'min': int(values[0]), 'max': int(values[1])}
-            except (ValueError, IndexError):
+                min_ms, max_ms = values.split(',')
+                return {'min': int(min_ms), 'max': int(max_ms)}
+            except ValueError:
                 return None
         return None
 
@@ -499,14 +538,15 @@ class LipsyncControl:
 class LoudnessControl:
     """Loudness control."""
 
+    __slots__ = ('_client',)
+
     def __init__(self, client):
         self._client = client
 
     def get(self) -> bool | None:
         """Get loudness status."""
         response = self._client._send_command('!LOUDNESS?')
-        if response and '!LOUDNESS(' in response:
-            state = response.split('(')[1].split(')')[0]
+        if (state := _parse_value(response, 'LOUDNESS')) is not None:
             return state == '1'
         return None
 
@@ -519,22 +559,22 @@ class LoudnessControl:
 class DTSDialogControl:
     """DTS Dialog Control (MP-60 only)."""
 
+    __slots__ = ('_client',)
+
     def __init__(self, client):
         self._client = client
 
     def is_available(self) -> bool:
         """Check if DTS Dialog Control is available."""
         response = self._client._send_command('!DTSDIALOGAVAILABLE?')
-        if response and '!DTSDIALOGAVAILABLE(' in response:
-            state = response.split('(')[1].split(')')[0]
+        if (state := _parse_value(response, 'DTSDIALOGAVAILABLE')) is not None:
             return state == '1'
         return False
 
     def get(self) -> float | None:
         """Get DTS Dialog Control setting in dB."""
         response = self._client._send_command('!DTSDIALOG?')
-        if response and '!DTSDIALOG(' in response:
-            value = response.split('(')[1].split(')')[0]
+        if (value := _parse_value(response, 'DTSDIALOG')) is not None:
             return protocol_to_db(int(value))
         return None
 
@@ -550,6 +590,8 @@ class DTSDialogControl:
 class Zone2Control:
     """Zone 2 control interface."""
 
+    __slots__ = ('_client', 'power', 'volume', 'mute', 'source')
+
     def __init__(self, client):
         self._client = client
         self.power = Zone2PowerControl(client)
@@ -561,6 +603,8 @@ class Zone2Control:
 class Zone2PowerControl:
     """Zone 2 power control."""
 
+    __slots__ = ('_client',)
+
     def __init__(self, client):
         self._client = client
 
@@ -575,8 +619,7 @@ class Zone2PowerControl:
     def get(self) -> bool | None:
         """Get Zone 2 power status."""
         response = self._client._send_command('!POWERZONE2?')
-        if response and '!POWERZONE2(' in response:
-            state = response.split('(')[1].split(')')[0]
+        if (state := _parse_value(response, 'POWERZONE2')) is not None:
             return state == '1'
         return None
 
@@ -584,15 +627,17 @@ class Zone2PowerControl:
 class Zone2VolumeControl:
     """Zone 2 volume control."""
 
+    __slots__ = ('_client', '_min_volume', '_max_volume')
+
     def __init__(self, client):
         self._client = client
+        # the model never changes, so read its volume range once
+        self._min_volume = client._model_config['min_volume']
+        self._max_volume = client._model_config['max_volume']
 
     def set(self, db: float):
         """Set Zone 2 volume in dB."""
-        value = db_to_protocol(db)
-        min_vol = self._client._model_config['min_volume']
-        max_vol = self._client._model_config['max_volume']
-        value = max(min_vol, min(max_vol, value))
+        value = max(self._min_volume, min(self._max_volume, db_to_protocol(db)))
         return self._client._send_command(f'!ZVOL({value})')
 
     def up(self, amount: float | None = None):
@@ -612,8 +657,7 @@ class Zone2VolumeControl:
     def get(self) -> float | None:
         """Get Zone 2 volume level in dB."""
         response = self._client._send_command('!ZVOL?')
-        if response and '!ZVOL(' in response:
-            vol = response.split('(')[1].split(')')[0]
+        if (vol := _parse_value(response, 'ZVOL')) is not None:
             return protocol_to_db(int(vol))
         return None
 
@@ -621,6 +665,8 @@ class Zone2VolumeControl:
 class Zone2MuteControl:
     """Zone 2 mute control."""
 
+    __slots__ = ('_client',)
+
     def __init__(self, client):
         self._client = client
 
@@ -647,9 +693,11 @@ class Zone2MuteControl:
 class Zone2SourceControl:
     """Zone 2 source control."""
 
+    __slots__ = ('_client', '_sources')
+
     def __init__(self, client):
         self._client = client
-        self._sources = {}
+        self._sources: dict[int, str] | None = None  # populated by discover()
 
     def discover(self) -> dict[int, str]:
         """Discover available Zone 2 sources."""
@@ -657,16 +705,7 @@ class Zone2SourceControl:
         if not response:
             return {}
 
-        sources = {}
-        lines = response.split('\r')
-        for line in lines:
-            if '!ZSRC(' in line and ')' in line and '"' in line:
-                try:
-                    idx = int(line.split('(')[1].split(')')[0])
-                    name = line.split('"')[1]
-                    sources[idx] = name
-                except (ValueError, IndexError):
-                    continue
+        sources = _parse_named_list(response, 'ZSRC')
 
         self._sources = sources
         return sources
@@ -678,14 +717,9 @@ class Zone2SourceControl:
     def get(self) -> dict[str, Any] | None:
         """Get Zone 2 current source."""
         response = self._client._send_command('!ZSRC?')
-        if response and '!ZSRC(' in response:
-            try:
-                parts = response.split('(')[1].split(')')
-                source_num = int(parts[0])
-                name = response.split('"')[1] if '"' in response else ''
-                return {'source': source_num, 'name': name}
-            except (ValueError, IndexError):
-                return None
+        if (parsed := _parse_named(response, 'ZSRC')) is not None:
+            source_num, name = parsed
+            return {'source': source_num, 'name': name}
         return None
 
     def next(self):
@@ -699,29 +733,24 @@ class Zone2SourceControl:
     def info(self, source: int) -> dict[str, Any] | None:
         """Get info for specific Zone 2 source."""
         response = self._client._send_command(f'!ZSRC({source})?')
-        if response and '!ZSRC(' in response:
-            try:
-                parts = response.split('(')[1].split(')')
-                source_num = int(parts[0])
-                name = response.split('"')[1] if '"' in response else ''
-                return {'source': source_num, 'name': name}
-            except (ValueError, IndexError):
-                return None
+        if (parsed := _parse_named(response, 'ZSRC')) is not None:
+            source_num, name = parsed
+            return {'source': source_num, 'name': name}
         return None
 
 
 class DeviceControl:
     """Device info and utility commands."""
 
+    __slots__ = ('_client',)
+
     def __init__(self, client):
         self._client = client
 
     def name(self) -> str | None:
         """Get device name."""
         response = self._client._send_command('!DEVICE?')
-        if response and '!DEVICE(' in response:
-            return response.split('(')[1].split(')')[0]
-        return None
+        return _parse_value(response, 'DEVICE')
 
     def ping(self) -> bool:
         """Ping device."""
@@ -731,9 +760,7 @@ class DeviceControl:
     def get_interface(self) -> str | None:
         """Get active interface (IP or SERIAL)."""
         response = self._client._send_command('!INTERFACE?')
-        if response and '!INTERFACE(' in response:
-            return response.split('(')[1].split(')')[0]
-        return None
+        return _parse_value(response, 'INTERFACE')
 
     def set_verbosity(self, level: int):
         """Set verbosity level (0, 1, or 2)."""
@@ -743,8 +770,7 @@ class DeviceControl:
     def get_verbosity(self) -> int | None:
         """Get current verbosity level."""
         response = self._client._send_command('!VERB?')
-        if response and '!VERB(' in response:
-            level = response.split('(')[1].split(')')[0]
+        if (level := _parse_value(response, 'VERB')) is not None:
             return int(level)
         return None
 
@@ -762,7 +788,7 @@ def get_lyngdorf(model_id: str, port_url: str, **serial_config_overrides) -> Lyn
         Synchronous Lyngdorf controller instance
     """
     if model_id not in SUPPORTED_MODELS:
-        LOG.error(f"Unsupported model '{model_id}'. Supported: {SUPPORTED_MODELS}")
+        LOG.error("Unsupported model '%s'. Supported: %s", model_id, SUPPORTED_MODELS)
         return None
 
     return LyngdorfSync(model_id, port_url, serial_config_overrides)
@@ -774,6 +800,10 @@ async def async_get_lyngdorf(
     """
     Get asynchronous Lyngdorf controller.
 
+    All I/O goes through the asyncio protocol from async_get_protocol; the returned
+    client never touches the blocking LyngdorfSync port code, so it is safe to use
+    from the event loop.
+
     Args:
         model_id: Model identifier (mp50, mp60)
         port_url: Serial port or socket URL
@@ -784,13 +814,13 @@ async def async_get_lyngdorf(
         Asynchronous Lyngdorf controller instance
     """
     if model_id not in SUPPORTED_MODELS:
-        LOG.error(f"Unsupported model '{model_id}'. Supported: {SUPPORTED_MODELS}")
+        LOG.error("Unsupported model '%s'. Supported: %s", model_id, SUPPORTED_MODELS)
         return None
 
     model_config = get_model_config(model_id)
     serial_config = model_config['rs232'].copy()
     if serial_config_overrides:
-        LOG.debug(f'Overriding serial config: {serial_config_overrides}')
+        LOG.debug('Overriding serial config: %s', serial_config_overrides)
         serial_config.update(serial_config_overrides)
 
     min_time_between_commands = model_config['min_time_between_commands']
@@ -811,17 +841,33 @@ class LyngdorfSync:
     """Synchronous Lyngdorf controller."""
 
     def __init__(self, model_id: str, port_url: str, serial_config_overrides: dict):
+        # lazy import, only the sync client talks to pyserial directly
+        import serial
+
         self._model_id = model_id
         self._model_config = get_model_config(model_id)
 
         # setup serial config
         serial_config = self._model_config['rs232'].copy()
         if serial_config_overrides:
-            LOG.debug(f'Overriding serial config: {serial_config_overrides}')
+            LOG.debug('Overriding serial config: %s', serial_config_overrides)
             serial_config.update(serial_config_overrides)
 
         self._port = serial.serial_for_url(port_url, **serial_config)
+        self._timeout_error = serial.SerialTimeoutException
+        enable_tcp_nodelay(self._port)
         self._lock = RLock()
+        # port buffers only need flushing after a reply went missing
+        self._needs_flush = True
+
+        # skip the USB serial latency timer on Linux ttys; socket:// ports lack the call
+        if hasattr(self._port, 'set_low_latency_mode'):
+            try:
+                self._port.set_low_latency_mode(True)
+            except ValueError as e:
+                LOG.debug('Low latency mode not available on %s: %s', port_url, e)
+        # query -> (monotonic time, reply), cleared by any command that changes state
+        self._response_cache: dict[str, tuple[float, str]] = {}
 
         # create control interfaces
         self.power = PowerControl(self)
@@ -844,52 +890,57 @@ class LyngdorfSync:
         self.device.set_verbosity(1)
 
     def _send_command(self, command: str) -> str | None:
-        """Send command and return response."""
+        """Send command and return response, reusing recent replies to queries."""
+        is_query = command.endswith('?')
         with self._lock:
-            # clear buffers
-            self._port.reset_output_buffer()
-            self._port.reset_input_buffer()
+            if is_query:
+                cached = self._response_cache.get(command)
+                if cached is not None and time.monotonic() - cached[0] < RESPONSE_CACHE_TTL:
+                    return cached[1]
+            else:
+                self._response_cache.clear()
+
+            # clear buffers; the lock keeps replies paired, so only a timeout leaves stale data
+            if self._needs_flush:
+                self._port.reset_output_buffer()
+                self._port.reset_input_buffer()
+                self._needs_flush = False
 
             # build request
-            request = (command + COMMAND_EOL).encode('ascii')
-            LOG.debug(f'Sending: {request}')
+            request = _encode_command(command)
+            LOG.debug('Sending: %s', request)
 
             # send
             self._port.write(request)
             self._port.flush()
 
-            # read response
-            result = bytearray()
-            eol_bytes = RESPONSE_EOL.encode('ascii')
+            # read response; read_until returns without the EOL if the port times out
+            result = self._port.read_until(RESPONSE_EOL_BYTES)
+            if not result.endswith(RESPONSE_EOL_BYTES):
+                self._needs_flush = True
+                LOG.warning('Timeout waiting for response to %s', command)
+                raise self._timeout_error(f'Connection timed out! Last received: {result}')
 
-            while True:
-                c = self._port.read(1)
-                if not c:
-                    LOG.warning(f'Timeout waiting for response to {command}')
-                    raise serial.SerialTimeoutException(
-                        f'Connection timed out! Last received: {bytes(result)}'
-                    )
-
-                result += c
-                if result.endswith(eol_bytes):
-                    break
-
-            response = bytes(result).decode('ascii').strip()
+            response = result.decode('ascii').strip()
 
             # filter out echo messages (# prefix) from verbosity level 2
             if response.startswith('#'):
-                # read next line for actual status
-                result = bytearray()
-                while True:
-                    c = self._port.read(1)
-                    if not c:
-                        break
-                    result += c
-                    if result.endswith(eol_bytes):
-                        break
-                response = bytes(result).decode('ascii').strip()
-
-            LOG.debug(f'Received: {response}')
+                # the status line normally arrives in the same burst as the echo, so take
+                # it from what is already buffered and only block if it is incomplete
+                lines = self._port.read(self._port.in_waiting).split(RESPONSE_EOL_BYTES)
+                status = next(
+                    (line for line in lines[:-1] if line.strip() and not line.startswith(b'#')),
+                    None,
+                )
+                if status is None:
+                    status = lines[-1] + self._port.read_until(RESPONSE_EOL_BYTES)
+                    # an unterminated line means the read timed out mid-reply
+                    self._needs_flush = not status.endswith(RESPONSE_EOL_BYTES)
+                response = status.decode('ascii').strip()
+
+            LOG.debug('Received: %s', response)
+            if is_query and response:
+                self._response_cache[command] = (time.monotonic(), response)
             return response
 
 
@@ -900,6 +951,10 @@ class LyngdorfAsync:
         self._model_id = model_id
         self._model_config = model_config
         self._protocol = protocol
+        # static query -> (monotonic time, reply), cleared by any command that changes state
+        self._static_cache: dict[str, tuple[float, str]] = {}
+        # query -> pending reply, so concurrent identical queries share one round trip
+        self._inflight: dict[str, asyncio.Task] = {}
 
         # create control interfaces
         self.power = AsyncPowerControl(self)
@@ -918,14 +973,58 @@ class LyngdorfAsync:
         if self._model_config.get('supports_dts_dialog'):
             self.dts_dialog = AsyncDTSDialogControl(self)
 
+    def register_state_callback(self, callback, state_type: str | None = None) -> None:
+        """
+        Register callback for unsolicited state updates pushed by the device.
+
+        Args:
+            callback: Called with (state_type, StateUpdate) for each update
+            state_type: Only notify for this state type (e.g. 'volume'), or None for all
+        """
+        if state_type is None:
+            self._protocol.register_general_callback(callback)
+        else:
+            self._protocol.register_state_callback(state_type, callback)
+
     async def _send_command(self, command: str) -> str | None:
-        """Send command and return response."""
-        request = (command + COMMAND_EOL).encode('ascii')
-        return await self._protocol.send(request)
+        """Send command and return response, reusing cached replies to static queries."""
+        if not command.endswith('?'):
+            self._static_cache.clear()
+            return await self._protocol.send(_encode_command(command))
+
+        if (cached := self._static_cache.get(command)) is not None:
+            ttl = STATIC_QUERY_TTL[command]
+            if ttl is None or time.monotonic() - cached[0] < ttl:
+                return cached[1]
+
+        # queries are idempotent, so join an identical one that is already on the wire;
+        # the send runs in its own task so cancelling one caller can't fail the others
+        if (task := self._inflight.get(command)) is None:
+            task = asyncio.ensure_future(self._send_query(command))
+            self._inflight[command] = task
+            task.add_done_callback(partial(self._query_done, command))
+        return await asyncio.shield(task)
+
+    async def _send_query(self, command: str) -> str | None:
+        """Send a query on behalf of every caller waiting for its reply."""
+        response = await self._protocol.send(_encode_command(command))
+        if response and command in STATIC_QUERY_TTL:
+            self._static_cache[command] = (time.monotonic(), response)
+        return response
+
+    def _query_done(self, command: str, task: asyncio.Task) -> None:
+        """Forget a finished query so the next caller sends it again."""
+        if self._inflight.get(command) is task:
+            del self._inflight[command]
+        # callers may all have been cancelled; don't report the error as unretrieved
+        if not task.cancelled():
+            task.exception()
 
 
 # Async versions of control classes
 class AsyncPowerControl(PowerControl):
+    __slots__ = ()
+
     async def on(self):
         return await self._client._send_command('!POWERONMAIN')
 
@@ -934,18 +1033,16 @@ class AsyncPowerControl(PowerControl):
 
     async def get(self) -> bool | None:
         response = await self._client._send_command('!POWER?')
-        if response and '!POWER(' in response:
-            state = response.split('(')[1].split(')')[0]
+        if (state := _parse_value(response, 'POWER')) is not None:
             return state == '1'
         return None
 
 
 class AsyncVolumeControl(VolumeControl):
+    __slots__ = ()
+
     async def set(self, db: float):
-        value = db_to_protocol(db)
-        min_vol = self._client._model_config['min_volume']
-        max_vol = self._client._model_config['max_volume']
-        value = max(min_vol, min(max_vol, value))
+        value = max(self._min_volume, min(self._max_volume, db_to_protocol(db)))
         return await self._client._send_command(f'!VOL({value})')
 
     async def up(self, amount: float | None = None):
@@ -962,15 +1059,13 @@ class AsyncVolumeControl(VolumeControl):
 
     async def get(self) -> float | None:
         response = await self._client._send_command('!VOL?')
-        if response and '!VOL(' in response:
-            vol = response.split('(')[1].split(')')[0]
+        if (vol := _parse_value(response, 'VOL')) is not None:
             return protocol_to_db(int(vol))
         return None
 
     async def get_max(self) -> float | None:
         response = await self._client._send_command('!MAXVOL?')
-        if response and '!MAXVOL(' in response:
-            max_vol = response.split('(')[1].split(')')[0]
+        if (max_vol := _parse_value(response, 'MAXVOL')) is not None:
             return protocol_to_db(int(max_vol))
         return None
 
@@ -980,8 +1075,7 @@ class AsyncVolumeControl(VolumeControl):
 
     async def get_default(self) -> float | None:
         response = await self._client._send_command('!DEFVOL?')
-        if response and '!DEFVOL(' in response:
-            defvol = response.split('(')[1].split(')')[0]
+        if (defvol := _parse_value(response, 'DEFVOL')) is not None:
             return protocol_to_db(int(defvol))
         return None
 
@@ -993,6 +1087,8 @@ class AsyncVolumeControl(VolumeControl):
 
 
 class AsyncMuteControl(MuteControl):
+    __slots__ = ()
+
     async def on(self):
         return await self._client._send_command('!MUTEON')
 
@@ -1010,21 +1106,14 @@ class AsyncMuteControl(MuteControl):
 
 
 class AsyncSourceControl(SourceControl):
+    __slots__ = ()
+
     async def discover(self) -> dict[int, str]:
         response = await self._client._send_command('!SRCS?')
         if not response:
             return {}
 
-        sources = {}
-        lines = response.split('\r')
-        for line in lines:
-            if '!SRC(' in line and ')' in line and '"' in line:
-                try:
-                    idx = int(line.split('(')[1].split(')')[0])
-                    name = line.split('"')[1]
-                    sources[idx] = name
-                except (ValueError, IndexError):
-                    continue
+        sources = _parse_named_list(response, 'SRC')
 
         self._sources = sources
         return sources
@@ -1034,14 +1123,9 @@ class AsyncSourceControl(SourceControl):
 
     async def get(self) -> dict[str, Any] | None:
         response = await self._client._send_command('!SRC?')
-        if response and '!SRC(' in response:
-            try:
-                parts = response.split('(')[1].split(')')
-                source_num = int(parts[0])
-                name = response.split('"')[1] if '"' in response else ''
-                return {'source': source_num, 'name': name}
-            except (ValueError, IndexError):
-                return None
+        if (parsed := _parse_named(response, 'SRC')) is not None:
+            source_num, name = parsed
+            return {'source': source_num, 'name': name}
         return None
 
     async def next(self):
@@ -1052,20 +1136,14 @@ class AsyncSourceControl(SourceControl):
 
     async def info(self, source: int) -> dict[str, Any] | None:
         response = await self._client._send_command(f'!SRC({source})?')
-        if response and '!SRC(' in response:
-            try:
-                parts = response.split('(')[1].split(')')
-                source_num = int(parts[0])
-                name = response.split('"')[1] if '"' in response else ''
-                return {'source': source_num, 'name': name}
-            except (ValueError, IndexError):
-                return None
+        if (parsed := _parse_named(response, 'SRC')) is not None:
+            source_num, name = parsed
+            return {'source': source_num, 'name': name}
         return None
 
     async def get_offset(self) -> float | None:
         response = await self._client._send_command('!SRCOFF?')
-        if response and '!SRCOFF(' in response:
-            offset = response.split('(')[1].split(')')[0]
+        if (offset := _parse_value(response, 'SRCOFF')) is not None:
             return protocol_to_db(int(offset))
         return None
 
@@ -1076,35 +1154,23 @@ class AsyncSourceControl(SourceControl):
 
 
 class AsyncRoomPerfectControl(RoomPerfectControl):
+    __slots__ = ()
+
     async def discover_positions(self) -> dict[int, str]:
         response = await self._client._send_command('!RPFOCS?')
         if not response:
             return {}
 
-        positions = {}
-        lines = response.split('\r')
-        for line in lines:
-            if '!RPFOC(' in line and ')' in line and '"' in line:
-                try:
-                    idx = int(line.split('(')[1].split(')')[0])
-                    name = line.split('"')[1]
-                    positions[idx] = name
-                except (ValueError, IndexError):
-                    continue
+        positions = _parse_named_list(response, 'RPFOC')
 
         self._positions = positions
         return positions
 
     async def get_position(self) -> dict[str, Any] | None:
         response = await self._client._send_command('!RPFOC?')
-        if response and '!RPFOC(' in response:
-            try:
-                parts = response.split('(')[1].split(')')
-                pos_num = int(parts[0])
-                name = response.split('"')[1] if '"' in response else ''
-                return {'position': pos_num, 'name': name}
-            except (ValueError, IndexError):
-                return None
+        if (parsed := _parse_named(response, 'RPFOC')) is not None:
+            pos_num, name = parsed
+            return {'position': pos_num, 'name': name}
         return None
 
     async def set_position(self, position: int):
@@ -1121,30 +1187,16 @@ class AsyncRoomPerfectControl(RoomPerfectControl):
         if not response:
             return {}
 
-        voicings = {}
-        lines = response.split('\r')
-        for line in lines:
-            if '!RPVOI(' in line and ')' in line and '"' in line:
-                try:
-                    idx = int(line.split('(')[1].split(')')[0])
-                    name = line.split('"')[1]
-                    voicings[idx] = name
-                except (ValueError, IndexError):
-                    continue
+        voicings = _parse_named_list(response, 'RPVOI')
 
         self._voicings = voicings
         return voicings
 
     async def get_voicing(self) -> dict[str, Any] | None:
         response = await self._client._send_command('!RPVOI?')
-        if response and '!RPVOI(' in response:
-            try:
-                parts = response.split('(')[1].split(')')
-                voi_num = int(parts[0])
-                name = response.split('"')[1] if '"' in response else ''
-                return {'voicing': voi_num, 'name': name}
-            except (ValueError, IndexError):
-                return None
+        if (parsed := _parse_named(response, 'RPVOI')) is not None:
+            voi_num, name = parsed
+            return {'voicing': voi_num, 'name': name}
         return None
 
     async def set_voicing(self, voicing: int):
@@ -1158,35 +1210,23 @@ class AsyncRoomPerfectControl(RoomPerfectControl):
 
 
 class AsyncAudioModeControl(AudioModeControl):
+    __slots__ = ()
+
     async def discover(self) -> dict[int, str]:
         response = await self._client._send_command('!AUDMODEL?')
         if not response:
             return {}
 
-        modes = {}
-        lines = response.split('\r')
-        for line in lines:
-            if '!AUDMODE(' in line and ')' in line and '"' in line:
-                try:
-                    idx = int(line.split('(')[1].split(')')[0])
-                    name = line.split('"')[1]
-                    modes[idx] = name
-                except (ValueError, IndexError):
-                    continue
+        modes = _parse_named_list(response, 'AUDMODE')
 
         self._modes = modes
         return modes
 
     async def get(self) -> dict[str, Any] | None:
         response = await self._client._send_command('!AUDMODE?')
-        if response and '!AUDMODE(' in response:
-            try:
-                parts = response.split('(')[1].split(')')
-                mode_num = int(parts[0])
-                name = response.split('"')[1] if '"' in response else ''
-                return {'mode': mode_num, 'name': name}
-            except (ValueError, IndexError):
-                return None
+        if (parsed := _parse_named(response, 'AUDMODE')) is not None:
+            mode_num, name = parsed
+            return {'mode': mode_num, 'name': name}
         return None
 
     async def set(self, mode: int):
@@ -1200,60 +1240,81 @@ class AsyncAudioModeControl(AudioModeControl):
 
 
 class AsyncTrimControl(TrimControl):
+    __slots__ = ()
+
     async def _get_trim(self, channel: str) -> float | None:
         response = await self._client._send_command(f'!TRIM{channel}?')
-        if response and f'!TRIM{channel}(' in response:
-            trim = response.split('(')[1].split(')')[0]
+        if (trim := _parse_value(response, f'TRIM{channel}')) is not None:
             return protocol_to_db(int(trim))
         return None
 
-    async def _set_trim(self, channel: str, db: float, min_db: float, max_db: float):
-        value = db_to_protocol(db)
-        value = max(int(min_db * 10), min(int(max_db * 10), value))
+    async def _set_trim(self, channel: str, db: float):
+        min_value, max_value = TRIM_LIMITS[channel]
+        value = max(min_value, min(max_value, db_to_protocol(db)))
         return await self._client._send_command(f'!TRIM{channel}({value})')
 
     async def get_bass(self) -> float | None:
         return await self._get_trim('BASS')
 
     async def set_bass(self, db: float):
-        return await self._set_trim('BASS', db, -12.0, 12.0)
+        return await self._set_trim('BASS', db)
 
     async def get_treble(self) -> float | None:
         return await self._get_trim('TREB')
 
     async def set_treble(self, db: float):
-        return await self._set_trim('TREB', db, -12.0, 12.0)
+        return await self._set_trim('TREB', db)
 
     async def get_center(self) -> float | None:
         return await self._get_trim('CENTER')
 
     async def set_center(self, db: float):
-        return await self._set_trim('CENTER', db, -10.0, 10.0)
+        return await self._set_trim('CENTER', db)
 
     async def get_lfe(self) -> float | None:
         return await self._get_trim('LFE')
 
     async def set_lfe(self, db: float):
-        return await self._set_trim('LFE', db, -10.0, 10.0)
+        return await self._set_trim('LFE', db)
 
     async def get_surrounds(self) -> float | None:
         return await self._get_trim('SURRS')
 
     async def set_surrounds(self, db: float):
-        return await self._set_trim('SURRS', db, -10.0, 10.0)
+        return await self._set_trim('SURRS', db)
 
     async def get_height(self) -> float | None:
         return await self._get_trim('HEIGHT')
 
     async def set_height(self, db: float):
-        return await self._set_trim('HEIGHT', db, -10.0, 10.0)
+        return await self._set_trim('HEIGHT', db)
+
+    async def get_all(self) -> dict[str, float | None]:
+        # the protocol has no combined trim query, so queue all six at once
+        bass, treble, center, lfe, surrounds, height = await asyncio.gather(
+            self.get_bass(),
+            self.get_treble(),
+            self.get_center(),
+            self.get_lfe(),
+            self.get_surrounds(),
+            self.get_height(),
+        )
+        return {
+            'bass': bass,
+            'treble': treble,
+            'center': center,
+            'lfe': lfe,
+            'surrounds': surrounds,
+            'height': height,
+        }
 
 
 class AsyncLipsyncControl(LipsyncControl):
+    __slots__ = ()
+
     async def get(self) -> int | None:
         response = await self._client._send_command('!LIPSYNC?')
-        if response and '!LIPSYNC(' in response:
-            delay = response.split('(')[1].split(')')[0]
+        if (delay := _parse_value(response, 'LIPSYNC')) is not None:
             return int(delay)
         return None
 
@@ -1268,20 +1329,21 @@ class AsyncLipsyncControl(LipsyncControl):
 
     async def get_range(self) -> dict[str, int] | None:
         response = await self._client._send_command('!LIPSYNCRANGE?')
-        if response and '!LIPSYNCRANGE(' in response:
+        if (values := _parse_value(response, 'LIPSYNCRANGE')) is not None:
             try:
-                values = response.split('(')[1].split(')')[0].split(',')
-                return {'min': int(values[0]), 'max': int(values[1])}
-            except (ValueError, IndexError):
+                min_ms, max_ms = values.split(',')
+                return {'min': int(min_ms), 'max': int(max_ms)}
+            except ValueError:
                 return None
         return None
 
 
 class AsyncLoudnessControl(LoudnessControl):
+    __slots__ = ()
+
     async def get(self) -> bool | None:
         response = await self._client._send_command('!LOUDNESS?')
-        if response and '!LOUDNESS(' in response:
-            state = response.split('(')[1].split(')')[0]
+        if (state := _parse_value(response, 'LOUDNESS')) is not None:
             return state == '1'
         return None
 
@@ -1291,17 +1353,17 @@ class AsyncLoudnessControl(LoudnessControl):
 
 
 class AsyncDTSDialogControl(DTSDialogControl):
+    __slots__ = ()
+
     async def is_available(self) -> bool:
         response = await self._client._send_command('!DTSDIALOGAVAILABLE?')
-        if response and '!DTSDIALOGAVAILABLE(' in response:
-            state = response.split('(')[1].split(')')[0]
+        if (state := _parse_value(response, 'DTSDIALOGAVAILABLE')) is not None:
             return state == '1'
         return False
 
     async def get(self) -> float | None:
         response = await self._client._send_command('!DTSDIALOG?')
-        if response and '!DTSDIALOG(' in response:
-            value = response.split('(')[1].split(')')[0]
+        if (value := _parse_value(response, 'DTSDIALOG')) is not None:
             return protocol_to_db(int(value))
         return None
 
@@ -1315,6 +1377,8 @@ class AsyncDTSDialogControl(DTSDialogControl):
 class AsyncZone2Control:
     """Async Zone 2 control interface."""
 
+    __slots__ = ('_client', 'power', 'volume', 'mute', 'source')
+
     def __init__(self, client):
         self._client = client
         self.power = AsyncZone2PowerControl(client)
@@ -1324,6 +1388,8 @@ class AsyncZone2Control:
 
 
 class AsyncZone2PowerControl(Zone2PowerControl):
+    __slots__ = ()
+
     async def on(self):
         return await self._client._send_command('!POWERONZONE2')
 
@@ -1332,18 +1398,16 @@ class AsyncZone2PowerControl(Zone2PowerControl):
 
     async def get(self) -> bool | None:
         response = await self._client._send_command('!POWERZONE2?')
-        if response and '!POWERZONE2(' in response:
-            state = response.split('(')[1].split(')')[0]
+        if (state := _parse_value(response, 'POWERZONE2')) is not None:
             return state == '1'
         return None
 
 
 class AsyncZone2VolumeControl(Zone2VolumeControl):
+    __slots__ = ()
+
     async def set(self, db: float):
-        value = db_to_protocol(db)
-        min_vol = self._client._model_config['min_volume']
-        max_vol = self._client._model_config['max_volume']
-        value = max(min_vol, min(max_vol, value))
+        value = max(self._min_volume, min(self._max_volume, db_to_protocol(db)))
         return await self._client._send_command(f'!ZVOL({value})')
 
     async def up(self, amount: float | None = None):
@@ -1360,13 +1424,14 @@ class AsyncZone2VolumeControl(Zone2VolumeControl):
 
     async def get(self) -> float | None:
         response = await self._client._send_command('!ZVOL?')
-        if response and '!ZVOL(' in response:
-            vol = response.split('(')[1].split(')')[0]
+        if (vol := _parse_value(response, 'ZVOL')) is not None:
             return protocol_to_db(int(vol))
         return None
 
 
 class AsyncZone2MuteControl(Zone2MuteControl):
+    __slots__ = ()
+
     async def on(self):
         return await self._client._send_command('!ZMUTEON')
 
@@ -1384,21 +1449,14 @@ class AsyncZone2MuteControl(Zone2MuteControl):
 
 
 class AsyncZone2SourceControl(Zone2SourceControl):
+    __slots__ = ()
+
     async def discover(self) -> dict[int, str]:
         response = await self._client._send_command('!ZSRCS?')
         if not response:
             return {}
 
-        sources = {}
-        lines = response.split('\r')
-        for line in lines:
-            if '!ZSRC(' in line and ')' in line and '"' in line:
-                try:
-                    idx = int(line.split('(')[1].split(')')[0])
-                    name = line.split('"')[1]
-                    sources[idx] = name
-                except (ValueError, IndexError):
-                    continue
+        sources = _parse_named_list(response, 'ZSRC')
 
         self._sources = sources
         return sources
@@ -1408,14 +1466,9 @@ class AsyncZone2SourceControl(Zone2SourceControl):
 
     async def get(self) -> dict[str, Any] | None:
         response = await self._client._send_command('!ZSRC?')
-        if response and '!ZSRC(' in response:
-            try:
-                parts = response.split('(')[1].split(')')
-                source_num = int(parts[0])
-                name = response.split('"')[1] if '"' in response else ''
-                return {'source': source_num, 'name': name}
-            except (ValueError, IndexError):
-                return None
+        if (parsed := _parse_named(response, 'ZSRC')) is not None:
+            source_num, name = parsed
+            return {'source': source_num, 'name': name}
         return None
 
     async def next(self):
@@ -1426,23 +1479,18 @@ class AsyncZone2SourceControl(Zone2SourceControl):
 
     async def info(self, source: int) -> dict[str, Any] | None:
         response = await self._client._send_command(f'!ZSRC({source})?')
-        if response and '!ZSRC(' in response:
-            try:
-                parts = response.split('(')[1].split(')')
-                source_num = int(parts[0])
-                name = response.split('"')[1] if '"' in response else ''
-                return {'source': source_num, 'name': name}
-            except (ValueError, IndexError):
-                return None
+        if (parsed := _parse_named(response, 'ZSRC')) is not None:
+            source_num, name = parsed
+            return {'source': source_num, 'name': name}
         return None
 
 
 class AsyncDeviceControl(DeviceControl):
+    __slots__ = ()
+
     async def name(self) -> str | None:
         response = await self._client._send_command('!DEVICE?')
-        if response and '!DEVICE(' in response:
-            return response.split('(')[1].split(')')[0]
-        return None
+        return _parse_value(response, 'DEVICE')
 
     async def ping(self) -> bool:
         response = await self._client._send_command('!PING?')
@@ -1450,9 +1498,7 @@ class AsyncDeviceControl(DeviceControl):
 
     async def get_interface(self) -> str | None:
         response = await self._client._send_command('!INTERFACE?')
-        if response and '!INTERFACE(' in response:
-            return response.split('(')[1].split(')')[0]
-        return None
+        return _parse_value(response, 'INTERFACE')
 
     async def set_verbosity(self, level: int):
         level = max(0, min(2, level))
@@ -1460,7 +1506,6 @@ class AsyncDeviceControl(DeviceControl):
 
     async def get_verbosity(self) -> int | None:
         response = await self._client._send_command('!VERB?')
-        if response and '!VERB(' in response:
-            level = response.split('(')[1].split(')')[0]
+        if (level := _parse_value(response, 'VERB')) is not None:
             return int(level)
         return None
@@ -17,26 +17,48 @@ async def main():
     # power control
     print('Power on')
     await device.power.on()
-    await asyncio.sleep(2)
 
-    power_state = await device.power.get()
+    # poll until the amplifier reports it is on instead of sleeping a fixed time
+    for _ in range(50):
+        if power_state := await device.power.get():
+            break
+        await asyncio.sleep(0.2)
     print(f'Power status: {power_state}')
 
+    # independent reads are queued back to back instead of awaited one by one
+    (
+        device_name,
+        interface,
+        verbosity,
+        max_vol,
+        sources,
+        positions,
+        voicings,
+        modes,
+    ) = await asyncio.gather(
+        device.device.name(),
+        device.device.get_interface(),
+        device.device.get_verbosity(),
+        device.volume.get_max(),
+        device.source.discover(),
+        device.roomperfect.discover_positions(),
+        device.roomperfect.discover_voicings(),
+        device.audio_mode.discover(),
+    )
+    print(f'Device name: {device_name}')
+    print(f'Device interface: {interface}')
+    print(f'Verbosity level: {verbosity}')
+    print(f'Max volume setting: {max_vol} dB')
+
     # volume control (dB scale)
     print('Setting volume to -35.0 dB')
     await device.volume.set(-35.0)
-    await asyncio.sleep(1)
 
     volume = await device.volume.get()
     print(f'Current volume: {volume} dB')
 
-    # get max volume setting
-    max_vol = await device.volume.get_max()
-    print(f'Max volume setting: {max_vol} dB')
-
     # increase volume by 1.5 dB
     await device.volume.up(1.5)
-    await asyncio.sleep(1)
 
     volume = await device.volume.get()
     print(f'Volume after increase: {volume} dB')
@@ -44,7 +66,6 @@ async def main():
     # mute control
     print('Muting')
     await device.mute.on()
-    await asyncio.sleep(1)
 
     mute_state = await device.mute.get()
     print(f'Mute status: {mute_state}')
@@ -52,8 +73,7 @@ async def main():
     await device.mute.off()
 
     # source control
-    print('\nDiscovering sources...')
-    sources = await device.source.discover()
+    print('\nSources:')
     for idx, name in sources.items():
         print(f'  {idx}: {name}')
 
@@ -64,7 +84,6 @@ async def main():
     # switch to source 1
     print('Switching to source 1')
     await device.source.set(1)
-    await asyncio.sleep(1)
 
     # get source volume offset
     offset = await device.source.get_offset()
@@ -72,7 +91,6 @@ async def main():
 
     # RoomPerfect control
     print('\nRoomPerfect positions:')
-    positions = await device.roomperfect.discover_positions()
     for idx, name in positions.items():
         print(f'  {idx}: {name}')
 
@@ -84,7 +102,6 @@ async def main():
 
     # RoomPerfect voicings
     print('\nRoomPerfect voicings:')
-    voicings = await device.roomperfect.discover_voicings()
     for idx, name in voicings.items():
         print(f'  {idx}: {name}')
 
@@ -93,7 +110,6 @@ async def main():
 
     # audio mode control
     print('\nAudio modes:')
-    modes = await device.audio_mode.discover()
     for idx, name in modes.items():
         print(f'  {idx}: {name}')
 
@@ -125,7 +141,6 @@ async def main():
     # Zone 2 control
     print('\nZone 2 power on')
     await device.zone_2.power.on()
-    await asyncio.sleep(1)
 
     print('Setting Zone 2 volume to -45.0 dB')
     await device.zone_2.volume.set(-45.0)
@@ -144,16 +159,6 @@ async def main():
     z2_source = await device.zone_2.source.get()
     print(f'Zone 2 current source: {z2_source}')
 
-    # device info
-    device_name = await device.device.name()
-    print(f'\nDevice name: {device_name}')
-
-    interface = await device.device.get_interface()
-    print(f'Device interface: {interface}')
-
-    verbosity = await device.device.get_verbosity()
-    print(f'Verbosity level: {verbosity}')
-
     # ping test
     ping_result = await device.device.ping()
     if ping_result:
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 # connection parameters
@@ -9,6 +11,7 @@ DEFAULT_BAUD_RATE = 115200
 DEFAULT_TIMEOUT = 2.0
 DEFAULT_IP_PORT = 84
 RESPONSE_EOL = '\r'
+RESPONSE_EOL_BYTES = RESPONSE_EOL.encode('ascii')
 COMMAND_EOL = '\r'
 
 # rate limiting
@@ -36,6 +39,12 @@ AUDIO_INPUTS: dict[int, str] = {
     24: 'Audio Return Channel',
 }
 
+# reverse lookup and id-ordered names for the default source list
+AUDIO_INPUTS_NAME_TO_ID: dict[str, int] = {
+    name: source_id for source_id, name in sorted(AUDIO_INPUTS.items())
+}
+AUDIO_INPUTS_NAMES: list[str] = list(AUDIO_INPUTS_NAME_TO_ID)
+
 # video input definitions (common to both models)
 VIDEO_INPUTS: dict[int, str] = {
     0: 'None',
@@ -69,63 +78,65 @@ STREAM_TYPES: dict[int, str] = {
     6: 'Roon Ready',
 }
 
-MODEL_CONFIGS: dict[str, dict[str, Any]] = {
-    'mp50': {
-        'name': 'MP-50',
-        'description': 'Lyngdorf MP-50 Surround Sound Processor',
-        'tested': False,
-        'min_volume': -999,  # -99.9dB
-        'max_volume': 200,  # +20.0dB
-        'volume_step': 1,  # 0.1dB steps
-        'supports_dts_dialog': False,
-        'supports_stream_type': False,
-        'supports_16ch_aes': False,
-        'min_time_between_commands': MIN_TIME_BETWEEN_GENERAL_COMMANDS,
-        'min_time_between_volume_commands': MIN_TIME_BETWEEN_COMMANDS,
-        'rs232': {
-            'baudrate': DEFAULT_BAUD_RATE,
-            'bytesize': 8,
-            'parity': 'N',
-            'stopbits': 1,
-            'timeout': DEFAULT_TIMEOUT,
-        },
-        'ip': {
-            'port': DEFAULT_IP_PORT,
-        },
-    },
-    'mp60': {
-        'name': 'MP-60',
-        'description': 'Lyngdorf MP-60 Surround Sound Processor',
-        'tested': False,
-        'min_volume': -999,  # -99.9dB
-        'max_volume': 240,  # +24.0dB
-        'volume_step': 1,  # 0.1dB steps
-        'supports_dts_dialog': True,
-        'supports_stream_type': True,
-        'supports_16ch_aes': True,  # optional module
-        'min_time_between_commands': MIN_TIME_BETWEEN_GENERAL_COMMANDS,
-        'min_time_between_volume_commands': MIN_TIME_BETWEEN_COMMANDS,
-        'rs232': {
-            'baudrate': DEFAULT_BAUD_RATE,
-            'bytesize': 8,
-            'parity': 'N',
-            'stopbits': 1,
-            'timeout': DEFAULT_TIMEOUT,
-        },
-        'ip': {
-            'port': DEFAULT_IP_PORT,
-        },
-    },
+# connection defaults shared by all models
+_RS232_DEFAULT: Mapping[str, Any] = MappingProxyType(
+    {
+        'baudrate': DEFAULT_BAUD_RATE,
+        'bytesize': 8,
+        'parity': 'N',
+        'stopbits': 1,
+        'timeout': DEFAULT_TIMEOUT,
+    }
+)
+_IP_DEFAULT: Mapping[str, Any] = MappingProxyType({'port': DEFAULT_IP_PORT})
+
+# read-only, so the config returned by get_model_config() can be shared without copying
+MODEL_CONFIGS: Mapping[str, Mapping[str, Any]] = {
+    'mp50': MappingProxyType(
+        {
+            'name': 'MP-50',
+            'description': 'Lyngdorf MP-50 Surround Sound Processor',
+            'tested': False,
+            'min_volume': -999,  # -99.9dB
+            'max_volume': 200,  # +20.0dB
+            'volume_step': 1,  # 0.1dB steps
+            'supports_dts_dialog': False,
+            'supports_stream_type': False,
+            'supports_16ch_aes': False,
+            'min_time_between_commands': MIN_TIME_BETWEEN_GENERAL_COMMANDS,
+            'min_time_between_volume_commands': MIN_TIME_BETWEEN_COMMANDS,
+            'rs232': _RS232_DEFAULT,
+            'ip': _IP_DEFAULT,
+        }
+    ),
+    'mp60': MappingProxyType(
+        {
+            'name': 'MP-60',
+            'description': 'Lyngdorf MP-60 Surround Sound Processor',
+            'tested': False,
+            'min_volume': -999,  # -99.9dB
+            'max_volume': 240,  # +24.0dB
+            'volume_step': 1,  # 0.1dB steps
+            'supports_dts_dialog': True,
+            'supports_stream_type': True,
+            'supports_16ch_aes': True,  # optional module
+            'min_time_between_commands': MIN_TIME_BETWEEN_GENERAL_COMMANDS,
+            'min_time_between_volume_commands': MIN_TIME_BETWEEN_COMMANDS,
+            'rs232': _RS232_DEFAULT,
+            'ip': _IP_DEFAULT,
+        }
+    ),
 }
 
 SUPPORTED_MODELS = list(MODEL_CONFIGS.keys())
 
 
-def get_model_config(model_id: str) -> dict[str, Any]:
+def get_model_config(model_id: str) -> Mapping[str, Any]:
     """Get configuration for a specific model."""
-    if model_id not in MODEL_CONFIGS:
-        raise ValueError(f"Unsupported model '{model_id}'. Supported: {SUPPORTED_MODELS}")
-    return MODEL_CONFIGS[model_id]
+    try:
+        return MODEL_CONFIGS[model_id]
+    except KeyError:
+        raise ValueError(f"Unsupported model '{model_id}'. Supported: {SUPPORTED_MODELS}") from None
 
 
 def db_to_protocol(db: float) -> int:
@@ -4,8 +4,11 @@ import asyncio
 import functools
 import logging
 import re
+import socket
+import sys
 import time
 from collections.abc import Callable
+from typing import Any, NamedTuple
 
 from .exceptions import (
     TimeoutError as LyngdorfTimeoutError,
@@ -15,24 +18,169 @@ LOG = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT = 2.0
 
-# regex patterns for parsing unsolicited state updates
+
+class StateUpdate(NamedTuple):
+    """Payload of an unsolicited state update."""
+
+    raw: str
+    groups: tuple[str, ...]
+
+
+# regex patterns for parsing unsolicited state updates; only the fallback path of
+# parse_state_update() needs them, so they are compiled on first use
 STATE_UPDATE_PATTERNS = {
-    'power': re.compile(r'!POWER\((\d+)\)'),
-    'power_zone2': re.compile(r'!POWERZONE2\((\d+)\)'),
-    'volume': re.compile(r'!VOL\((-?\d+)\)'),
-    'volume_zone2': re.compile(r'!ZVOL\((-?\d+)\)'),
-    'mute': re.compile(r'!MUTE(ON|OFF)'),
-    'mute_zone2': re.compile(r'!ZMUTE(ON|OFF)'),
-    'source': re.compile(r'!SRC\((\d+)\)"([^"]*)"'),
-    'source_zone2': re.compile(r'!ZSRC\((\d+)\)"([^"]*)"'),
-    'roomperfect_position': re.compile(r'!RPFOC\((\d+)\)"([^"]*)"'),
-    'roomperfect_voicing': re.compile(r'!RPVOI\((\d+)\)"([^"]*)"'),
-    'audio_mode': re.compile(r'!AUDMODE\((\d+)\)"([^"]*)"'),
-    'lipsync': re.compile(r'!LIPSYNC\((\d+)\)'),
-    'loudness': re.compile(r'!LOUDNESS\((\d+)\)'),
+    'power': r'!POWER\((\d+)\)',
+    'power_zone2': r'!POWERZONE2\((\d+)\)',
+    'volume': r'!VOL\((-?\d+)\)',
+    'volume_zone2': r'!ZVOL\((-?\d+)\)',
+    'mute': r'!MUTE(ON|OFF)',
+    'mute_zone2': r'!ZMUTE(ON|OFF)',
+    'source': r'!SRC\((\d+)\)"([^"]*)"',
+    'source_zone2': r'!ZSRC\((\d+)\)"([^"]*)"',
+    'roomperfect_position': r'!RPFOC\((\d+)\)"([^"]*)"',
+    'roomperfect_voicing': r'!RPVOI\((\d+)\)"([^"]*)"',
+    'audio_mode': r'!AUDMODE\((\d+)\)"([^"]*)"',
+    'lipsync': r'!LIPSYNC\((\d+)\)',
+    'loudness': r'!LOUDNESS\((\d+)\)',
 }
 
 
+@functools.cache
+def _combined_state_update_pattern() -> tuple[re.Pattern[str], dict[str, slice]]:
+    """Compile all state update patterns into one alternation.
+
+    A message is scanned once instead of once per pattern; the named group that
+    matched identifies the state type, and the returned slices select that state
+    type's own groups from match.groups().
+    """
+    combined = re.compile(
+        '|'.join(f'(?P<{key}>{pattern})' for key, pattern in STATE_UPDATE_PATTERNS.items()),
+        re.ASCII,
+    )
+    group_slices = {
+        state_type: slice(index, index + re.compile(STATE_UPDATE_PATTERNS[state_type]).groups)
+        for state_type, index in combined.groupindex.items()
+    }
+    return combined, group_slices
+
+
+def enable_tcp_nodelay(port: Any) -> None:
+    """Send short commands right away on socket:// ports instead of waiting on Nagle."""
+    # pyserial's socket handler keeps the connection in _socket; real serial ports have none
+    sock = getattr(port, '_socket', None)
+    if sock is None:
+        return
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    except OSError as e:
+        LOG.debug('Could not set socket options: %s', e)
+
+
+def _import_serial_asyncio() -> Callable:
+    """Import pyserial-asyncio-fast, pulling in pyserial."""
+    from serial_asyncio_fast import create_serial_connection
+
+    return create_serial_connection
+
+
+def _parse_number(args: str) -> tuple[str, ...] | None:
+    """Parse '(<n>)' arguments."""
+    end = args.find(')')
+    if end >= 0 and args[:1] == '(' and args[1:end].isdigit():
+        return (args[1:end],)
+    return None
+
+
+def _parse_signed_number(args: str) -> tuple[str, ...] | None:
+    """Parse '(<n>)' arguments where n may be negative."""
+    end = args.find(')')
+    if end >= 0 and args[:1] == '(' and args[1:end].removeprefix('-').isdigit():
+        return (args[1:end],)
+    return None
+
+
+def _parse_number_name(args: str) -> tuple[str, ...] | None:
+    """Parse '(<n>)"<name>"' arguments."""
+    end = args.find(')')
+    if end < 0 or args[:1] != '(' or not args[1:end].isdigit() or args[end + 1 : end + 2] != '"':
+        return None
+    name_end = args.find('"', end + 2)
+    if name_end < 0:
+        return None
+    return (args[1:end], args[end + 2 : name_end])
+
+
+def _parse_on(_args: str) -> tuple[str, ...]:
+    """Groups for an 'ON' tag without arguments."""
+    return ('ON',)
+
+
+def _parse_off(_args: str) -> tuple[str, ...]:
+    """Groups for an 'OFF' tag without arguments."""
+    return ('OFF',)
+
+
+# fast path for well-formed updates: message tag (between '!' and '(') -> state type and
+# argument parser; tags without arguments (mute) map straight to their groups
+_STATE_UPDATE_PARSERS: dict[str, tuple[str, Callable[[str], tuple[str, ...] | None]]] = {
+    'POWER': ('power', _parse_number),
+    'POWERZONE2': ('power_zone2', _parse_number),
+    'VOL': ('volume', _parse_signed_number),
+    'ZVOL': ('volume_zone2', _parse_signed_number),
+    'MUTEON': ('mute', _parse_on),
+    'MUTEOFF': ('mute', _parse_off),
+    'ZMUTEON': ('mute_zone2', _parse_on),
+    'ZMUTEOFF': ('mute_zone2', _parse_off),
+    'SRC': ('source', _parse_number_name),
+    'ZSRC': ('source_zone2', _parse_number_name),
+    'RPFOC': ('roomperfect_position', _parse_number_name),
+    'RPVOI': ('roomperfect_voicing', _parse_number_name),
+    'AUDMODE': ('audio_mode', _parse_number_name),
+    'LIPSYNC': ('lipsync', _parse_number),
+    'LOUDNESS': ('loudness', _parse_number),
+}
+
+
+def parse_state_update(message: str) -> tuple[str, StateUpdate] | None:
+    """Parse message to extract state update information."""
+    if message.startswith('!'):
+        paren = message.find('(')
+        if paren < 0:
+            paren = len(message)
+        parser = _STATE_UPDATE_PARSERS.get(message[1:paren])
+        if parser is not None:
+            state_type, parse_args = parser
+            groups = parse_args(message[paren:])
+            if groups is not None:
+                return (state_type, StateUpdate(message, groups))
+
+    # fall back to scanning, e.g. for updates preceded by noise or split across reads
+    pattern, group_slices = _combined_state_update_pattern()
+    match = pattern.search(message)
+    if match is None:
+        return None
+    state_type = match.lastgroup
+    groups = match.groups()[group_slices[state_type]]
+    return (state_type, StateUpdate(message, groups))
+
+
+# queries answered with a '!TAGS(<n>)' header line followed by n listing lines
+LISTING_QUERIES = frozenset({b'!SRCS?', b'!ZSRCS?', b'!RPFOCS?', b'!RPVOIS?', b'!AUDMODEL?'})
+
+
+def _listing_count(header: bytes) -> int:
+    """Return the number of listing lines announced by a '!TAGS(<n>)' header."""
+    start = header.find(b'(')
+    end = header.find(b')', start + 1)
+    if start < 0 or end < 0:
+        return 0
+    try:
+        return int(header[start + 1 : end])
+    except ValueError:
+        return 0
+
+
 async def async_get_protocol(
     serial_port: str,
     min_time_between_commands: float,
@@ -60,7 +208,7 @@ async def async_get_protocol(
             try:
                 await asyncio.wait_for(self._connected.wait(), self._timeout)
             except Exception:
-                LOG.debug(f'Timeout sending data to {self._serial_port}, no connection')
+                LOG.debug('Timeout sending data to %s, no connection', self._serial_port)
                 return
             return await method(self, *method_args, **method_kwargs)
 
@@ -81,6 +229,7 @@ async def async_get_protocol(
             self._serial_port = serial_port
             self._min_time_between_commands = min_time_between_commands
             self._response_eol = response_eol
+            self._response_eol_bytes = response_eol.encode('ascii')
             self._serial_config = serial_config
             self._loop = loop
 
@@ -89,64 +238,64 @@ async def async_get_protocol(
 
             self._transport = None
             self._connected = asyncio.Event()
-            self._q = asyncio.Queue()
             self._lock = asyncio.Lock()
+            # received data is only buffered while send() waits for a reply; the event
+            # fires once the buffer holds a complete line
+            self._awaiting_reply = False
+            self._rx_buf = bytearray()
+            self._response_ready = asyncio.Event()
+            # serial buffers only need flushing after a (re)connect or a missed reply
+            self._needs_flush = True
 
-            # callback system for unsolicited state updates
-            self._state_callbacks: dict[str, list[Callable]] = {}
-            self._general_callback: Callable | None = None
+            # callback system for unsolicited state updates, stored with whether each
+            # callback is a coroutine function so dispatch doesn't re-inspect it
+            self._state_callbacks: dict[str, list[tuple[Callable, bool]]] = {}
+            self._general_callback: tuple[Callable, bool] | None = None
 
-            LOG.info(f'Lyngdorf protocol timeout set to {self._timeout}s')
+            LOG.info('Lyngdorf protocol timeout set to %ss', self._timeout)
 
         def register_state_callback(self, state_type: str, callback: Callable) -> None:
             """Register callback for specific state updates (e.g., 'power', 'volume')."""
             if state_type not in self._state_callbacks:
                 self._state_callbacks[state_type] = []
-            self._state_callbacks[state_type].append(callback)
-            LOG.debug(f'Registered callback for {state_type} updates')
+            self._state_callbacks[state_type].append(
+                (callback, asyncio.iscoroutinefunction(callback))
+            )
+            LOG.debug('Registered callback for %s updates', state_type)
 
         def register_general_callback(self, callback: Callable) -> None:
             """Register callback for all state updates."""
-            self._general_callback = callback
+            self._general_callback = (callback, asyncio.iscoroutinefunction(callback))
             LOG.debug('Registered general state update callback')
 
-        def _parse_state_update(self, message: str) -> tuple[str, dict] | None:
-            """Parse message to extract state update information."""
-            # try each pattern to identify the state type
-            for state_type, pattern in STATE_UPDATE_PATTERNS.items():
-                match = pattern.search(message)
-                if match:
-                    data = {'raw': message, 'groups': match.groups()}
-                    return (state_type, data)
-            return None
-
-        def _dispatch_state_update(self, state_type: str, data: dict) -> None:
+        def _dispatch_state_update(self, state_type: str, data: StateUpdate) -> None:
             """Dispatch state update to registered callbacks."""
             # call state-specific callbacks
-            if state_type in self._state_callbacks:
-                for callback in self._state_callbacks[state_type]:
-                    try:
-                        if asyncio.iscoroutinefunction(callback):
-                            asyncio.create_task(callback(state_type, data))
-                        else:
-                            callback(state_type, data)
-                    except Exception as e:
-                        LOG.exception(f'Error in {state_type} callback: {e}')
+            for callback, is_coroutine in self._state_callbacks.get(state_type, ()):
+                try:
+                    if is_coroutine:
+                        self._loop.create_task(callback(state_type, data))
+                    else:
+                        callback(state_type, data)
+                except Exception as e:
+                    LOG.exception('Error in %s callback: %s', state_type, e)
 
             # call general callback
             if self._general_callback:
+                callback, is_coroutine = self._general_callback
                 try:
-                    if asyncio.iscoroutinefunction(self._general_callback):
-                        asyncio.create_task(self._general_callback(state_type, data))
+                    if is_coroutine:
+                        self._loop.create_task(callback(state_type, data))
                     else:
-                        self._general_callback(state_type, data)
+                        callback(state_type, data)
                 except Exception as e:
-                    LOG.exception(f'Error in general callback: {e}')
+                    LOG.exception('Error in general callback: %s', e)
 
         def connection_made(self, transport):
             """Handle connection established."""
             self._transport = transport
-            LOG.debug(f'Port {self._serial_port} opened')
+            enable_tcp_nodelay(getattr(transport, 'serial', None))
+            LOG.debug('Port %s opened', self._serial_port)
             self._connected.set()
 
         def data_received(self, data):
@@ -157,25 +306,44 @@ async def async_get_protocol(
             1. Responses to sent commands (queued for send() method)
             2. Unsolicited state updates (dispatched to callbacks)
             """
-            # always queue the data for send() method to consume
-            asyncio.ensure_future(self._q.put(data))
+            # while a reply is awaited all data goes to send(); replies to our own
+            # queries must not look like pushes, and send() dispatches any other
+            # status lines that arrived along with the reply
+            if self._awaiting_reply:
+                start = max(0, len(self._rx_buf) - len(self._response_eol_bytes) + 1)
+                self._rx_buf += data
+                if self._rx_buf.find(self._response_eol_bytes, start) >= 0:
+                    self._response_ready.set()
+                return
+
+            self._handle_push(data)
+
+        def _handle_push(self, data: bytes) -> None:
+            """Parse an unsolicited status line and dispatch it to the callbacks."""
+            # nobody listens for state updates, don't parse
+            if self._general_callback is None and not self._state_callbacks:
+                return
+
+            # skip empty and echo messages before paying for a decode
+            raw = data.strip()
+            if not raw or raw.startswith(b'#'):
+                return
 
             # try to parse as state update and dispatch callbacks
             try:
-                message = data.decode('ascii', errors='ignore').strip()
-                if message and not message.startswith('#'):  # skip echo messages
-                    state_update = self._parse_state_update(message)
-                    if state_update:
-                        state_type, state_data = state_update
-                        LOG.debug(f'Unsolicited state update: {state_type} = {state_data}')
-                        self._dispatch_state_update(state_type, state_data)
+                state_update = parse_state_update(raw.decode('ascii', errors='ignore'))
+                if state_update:
+                    state_type, state_data = state_update
+                    LOG.debug('Unsolicited state update: %s = %s', state_type, state_data)
+                    self._dispatch_state_update(state_type, state_data)
             except Exception as e:
-                LOG.debug(f'Error parsing state update: {e}')
+                LOG.debug('Error parsing state update: %s', e)
 
         def connection_lost(self, exc):
             """Handle connection lost."""
-            LOG.debug(f'Port {self._serial_port} closed')
+            LOG.debug('Port %s closed', self._serial_port)
             self._connected.clear()
+            self._needs_flush = True
 
         async def _throttle_requests(self):
             """Throttle RS232 sends to avoid causing timeouts."""
@@ -183,7 +351,7 @@ async def async_get_protocol(
 
             if delta < self._min_time_between_commands:
                 delay = max(0, self._min_time_between_commands - delta)
-                LOG.debug(f'Throttling: sleeping {delay:.3f}s before next command')
+                LOG.debug('Throttling: sleeping %.3fs before next command', delay)
                 await asyncio.sleep(delay)
 
         @locked_method
@@ -192,58 +360,77 @@ async def async_get_protocol(
             """Send command and optionally wait for response."""
             await self._throttle_requests()
 
-            # clear buffers
-            self._transport.serial.reset_output_buffer()
-            self._transport.serial.reset_input_buffer()
-            while not self._q.empty():
-                self._q.get_nowait()
+            # clear buffers; sends are serialized, so leftovers only remain after errors
+            if self._needs_flush:
+                self._transport.serial.reset_output_buffer()
+                self._transport.serial.reset_input_buffer()
+                self._needs_flush = False
+            self._rx_buf.clear()
+            self._response_ready.clear()
 
             # send command
-            LOG.debug(f'Sending: {request}')
+            LOG.debug('Sending: %s', request)
             self._last_send = time.time()
+            self._awaiting_reply = wait_for_reply
             self._transport.serial.write(request)
 
             if not wait_for_reply:
                 return None
 
             # read response - handle verbosity level 2 echo (# prefix)
-            data = bytearray()
-            response_eol_bytes = self._response_eol.encode('ascii')
+            response_eol_bytes = self._response_eol_bytes
+            # discovery queries are answered with a header plus one line per entry
+            is_listing = request.strip() in LISTING_QUERIES
+            expected = 1
+            reply: list[bytes] = []
 
             try:
                 while True:
-                    data += await asyncio.wait_for(self._q.get(), self._timeout)
+                    await asyncio.wait_for(self._response_ready.wait(), self._timeout)
 
-                    if response_eol_bytes in data:
-                        LOG.debug(
-                            f'Received: {data.decode("ascii", errors="ignore")} (len={len(data)})'
-                        )
+                    # consume complete lines, keep a trailing partial line buffered
+                    end = self._rx_buf.rfind(response_eol_bytes) + len(response_eol_bytes)
+                    data = bytes(self._rx_buf[:end])
+                    del self._rx_buf[:end]
+                    self._response_ready.clear()
 
-                        # split by EOL and filter empty lines
-                        lines = data.split(response_eol_bytes)
-                        lines = [line for line in lines if line]
+                    LOG.debug('Received: %s (len=%d)', data, len(data))
 
-                        if not lines:
-                            return ''
+                    # split by EOL and filter empty lines
+                    lines = [line for line in data.split(response_eol_bytes) if line]
 
-                        # filter out echo messages (# prefix) from verbosity level 2
-                        status_lines = [line for line in lines if not line.startswith(b'#')]
+                    if not lines and not reply:
+                        return ''
 
-                        if not status_lines:
-                            # only echo received, no status - wait for more data
-                            data = bytearray()
+                    for line in lines:
+                        # filter out echo messages (# prefix) from verbosity level 2
+                        if line.startswith(b'#'):
                             continue
+                        if len(reply) < expected:
+                            reply.append(line)
+                            if is_listing and len(reply) == 1:
+                                expected += _listing_count(line)
+                        else:
+                            # a push that arrived together with the reply
+                            self._handle_push(line)
 
-                        if len(status_lines) > 1:
-                            LOG.debug(f'Multiple response lines, using first: {status_lines}')
-
-                        return status_lines[0].decode('ascii', errors='ignore')
+                    if len(reply) >= expected:
+                        return self._response_eol.join(
+                            line.decode('ascii', errors='ignore') for line in reply
+                        )
 
             except TimeoutError as e:
+                # a late reply must not be read as the answer to the next command
+                self._needs_flush = True
                 LOG.warning(
-                    f'Timeout waiting for response to {request}: received={data} ({self._timeout}s)'
+                    'Timeout waiting for response to %s: received=%s (%ss)',
+                    request,
+                    self._rx_buf,
+                    self._timeout,
                 )
                 raise LyngdorfTimeoutError(f'Timeout waiting for response: {self._timeout}s') from e
+            finally:
+                self._awaiting_reply = False
 
     # create protocol factory
     factory = functools.partial(
@@ -255,15 +442,13 @@ async def async_get_protocol(
         loop,
     )
 
-    LOG.info(f'Creating connection to {serial_port}: {serial_config}')
-
-    # lazy import to avoid blocking
-    def _import_serial_asyncio():
-        from serial_asyncio import create_serial_connection
-
-        return create_serial_connection
+    LOG.info('Creating connection to %s: %s', serial_port, serial_config)
 
-    create_serial_connection = await loop.run_in_executor(None, _import_serial_asyncio)
+    # lazy import to avoid blocking; only the first connection needs the executor hop
+    if (serial_asyncio := sys.modules.get('serial_asyncio_fast')) is not None:
+        create_serial_connection = serial_asyncio.create_serial_connection
+    else:
+        create_serial_connection = await loop.run_in_executor(None, _import_serial_asyncio)
 
     # create connection
     _, protocol = await create_serial_connection(loop, factory, serial_port, **serial_config)
@@ -18,7 +18,7 @@ setup(
     python_requires='>=3.8',
     install_requires=[
         'pyserial>=3.5',
-        'pyserial-asyncio>=0.6',
+        'pyserial-asyncio-fast>=0.11',
     ],
     classifiers=[
         'Development Status :: 4 - Beta',
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class PowerState:
     """Power state for a zone."""
 
@@ -13,7 +13,7 @@ class PowerState:
     zone2: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class VolumeState:
     """Volume state for a zone."""
 
@@ -23,7 +23,7 @@ class VolumeState:
     default_volume: float | None = None  # dB
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceInfo:
     """Source information."""
 
@@ -32,7 +32,7 @@ class SourceInfo:
     offset: float = 0.0  # volume offset in dB
 
 
-@dataclass
+@dataclass(slots=True)
 class RoomPerfectState:
     """RoomPerfect calibration state."""
 
@@ -42,7 +42,7 @@ class RoomPerfectState:
     voicing_name: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioModeState:
     """Audio processing mode state."""
 
@@ -50,7 +50,7 @@ class AudioModeState:
     mode_name: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TrimSettings:
     """Channel trim settings in dB."""
 
@@ -62,7 +62,7 @@ class TrimSettings:
     height: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioInfo:
     """Current audio stream information."""
 
@@ -72,7 +72,7 @@ class AudioInfo:
     bitrate: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoInfo:
     """Current video stream information."""
 
@@ -84,14 +84,14 @@ class VideoInfo:
     format: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceState:
     """Complete device state."""
 
     # basic controls
-    power: PowerState
-    volume_main: VolumeState
-    volume_zone2: VolumeState
+    power: PowerState = field(default_factory=PowerState)
+    volume_main: VolumeState = field(default_factory=VolumeState)
+    volume_zone2: VolumeState = field(default_factory=VolumeState)
     source_main: SourceInfo | None = None
     source_zone2: SourceInfo | None = None
 
@@ -2,16 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from homeassistant.components.select import SelectEntity
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import LyngdorfConfigEntry
-from .const import DOMAIN
 from .coordinator import LyngdorfCoordinator
 
 LOG = logging.getLogger(__name__)
@@ -28,25 +27,39 @@ async def async_setup_entry(
 
     entities: list[SelectEntity] = []
 
-    # discover RoomPerfect positions
-    positions = await client.roomperfect.discover_positions()
-    if positions:
-        entities.append(LyngdorfRoomPerfectPositionSelect(coordinator, positions))
-
-    # discover RoomPerfect voicings
-    voicings = await client.roomperfect.discover_voicings()
-    if voicings:
-        entities.append(LyngdorfRoomPerfectVoicingSelect(coordinator, voicings))
-
-    # discover audio modes
-    audio_modes = await client.audio_mode.discover()
-    if audio_modes:
-        entities.append(LyngdorfAudioModeSelect(coordinator, audio_modes))
+    # discover RoomPerfect positions, voicings and audio modes in one batch; a failed
+    # discovery only drops its own select
+    positions, voicings, audio_modes = await asyncio.gather(
+        client.roomperfect.discover_positions(),
+        client.roomperfect.discover_voicings(),
+        client.audio_mode.discover(),
+        return_exceptions=True,
+    )
+
+    if _discovered(positions, 'RoomPerfect positions'):
+        entities.append(LyngdorfRoomPerfectPositionSelect(coordinator, _name_to_id(positions)))
+    if _discovered(voicings, 'RoomPerfect voicings'):
+        entities.append(LyngdorfRoomPerfectVoicingSelect(coordinator, _name_to_id(voicings)))
+    if _discovered(audio_modes, 'audio modes'):
+        entities.append(LyngdorfAudioModeSelect(coordinator, _name_to_id(audio_modes)))
 
     if entities:
         async_add_entities(entities, update_before_add=True)
 
 
+def _discovered(options: dict[int, str] | BaseException, what: str) -> bool:
+    """Return True if discovery found options, logging a failed discovery."""
+    if isinstance(options, BaseException):
+        LOG.warning('Could not discover %s: %s', what, options)
+        return False
+    return bool(options)
+
+
+def _name_to_id(options: dict[int, str]) -> dict[str, int]:
+    """Invert discovered id to name options, keeping the device's order."""
+    return {name: idx for idx, name in options.items()}
+
+
 class LyngdorfSelectEntity(CoordinatorEntity[LyngdorfCoordinator], SelectEntity):
     """Base class for Lyngdorf select entities."""
 
@@ -59,15 +72,17 @@ class LyngdorfSelectEntity(CoordinatorEntity[LyngdorfCoordinator], SelectEntity)
     ) -> None:
         """Initialize the select entity."""
         super().__init__(coordinator)
-        self._attr_unique_id = f'{DOMAIN}_{coordinator.model_id}_{entity_type}'.lower()
+        self._attr_unique_id = f'{coordinator.unique_id_prefix}{entity_type}'
+        self._attr_device_info = coordinator.device_info
+        self._last_state: tuple[bool, str | None] | None = None
 
-        model_name = coordinator.client._model_config['name']
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f'{DOMAIN}_{coordinator.model_id}')},
-            manufacturer='Lyngdorf',
-            model=model_name,
-            name=f'Lyngdorf {model_name}',
-        )
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if the selected option or availability changed."""
+        state = (self.available, self.current_option)
+        if state != self._last_state:
+            self._last_state = state
+            super()._handle_coordinator_update()
 
 
 class LyngdorfRoomPerfectPositionSelect(LyngdorfSelectEntity):
@@ -78,26 +93,26 @@ class LyngdorfRoomPerfectPositionSelect(LyngdorfSelectEntity):
     def __init__(
         self,
         coordinator: LyngdorfCoordinator,
-        positions: dict[int, str],
+        position_name_to_id: dict[str, int],
     ) -> None:
         """Initialize RoomPerfect position select."""
         super().__init__(coordinator, 'roomperfect_position')
-        self._positions = positions
-        self._position_name_to_id = {name: idx for idx, name in positions.items()}
-        self._attr_options = list(self._position_name_to_id.keys())
+        self._position_name_to_id = position_name_to_id
+        self._attr_options = list(position_name_to_id)
 
     @property
     def current_option(self) -> str | None:
         """Return current RoomPerfect position."""
-        if self.coordinator.data.roomperfect:
-            return self.coordinator.data.roomperfect.position_name
-        return None
+        if (roomperfect := self.coordinator.data.roomperfect) is None:
+            return None
+        return roomperfect.position_name
 
     async def async_select_option(self, option: str) -> None:
         """Set RoomPerfect position."""
         position_id = self._position_name_to_id.get(option)
         if position_id is not None:
             await self.coordinator.client.roomperfect.set_position(position_id)
+            self.coordinator.async_mark_stale('roomperfect')
             await self.coordinator.async_request_refresh()
 
 
@@ -109,26 +124,26 @@ class LyngdorfRoomPerfectVoicingSelect(LyngdorfSelectEntity):
     def __init__(
         self,
         coordinator: LyngdorfCoordinator,
-        voicings: dict[int, str],
+        voicing_name_to_id: dict[str, int],
     ) -> None:
         """Initialize RoomPerfect voicing select."""
         super().__init__(coordinator, 'roomperfect_voicing')
-        self._voicings = voicings
-        self._voicing_name_to_id = {name: idx for idx, name in voicings.items()}
-        self._attr_options = list(self._voicing_name_to_id.keys())
+        self._voicing_name_to_id = voicing_name_to_id
+        self._attr_options = list(voicing_name_to_id)
 
     @property
     def current_option(self) -> str | None:
         """Return current RoomPerfect voicing."""
-        if self.coordinator.data.roomperfect:
-            return self.coordinator.data.roomperfect.voicing_name
-        return None
+        if (roomperfect := self.coordinator.data.roomperfect) is None:
+            return None
+        return roomperfect.voicing_name
 
     async def async_select_option(self, option: str) -> None:
         """Set RoomPerfect voicing."""
         voicing_id = self._voicing_name_to_id.get(option)
         if voicing_id is not None:
             await self.coordinator.client.roomperfect.set_voicing(voicing_id)
+            self.coordinator.async_mark_stale('roomperfect')
             await self.coordinator.async_request_refresh()
 
 
@@ -140,24 +155,24 @@ class LyngdorfAudioModeSelect(LyngdorfSelectEntity):
     def __init__(
         self,
         coordinator: LyngdorfCoordinator,
-        modes: dict[int, str],
+        mode_name_to_id: dict[str, int],
     ) -> None:
         """Initialize audio mode select."""
         super().__init__(coordinator, 'audio_mode')
-        self._modes = modes
-        self._mode_name_to_id = {name: idx for idx, name in modes.items()}
-        self._attr_options = list(self._mode_name_to_id.keys())
+        self._mode_name_to_id = mode_name_to_id
+        self._attr_options = list(mode_name_to_id)
 
     @property
     def current_option(self) -> str | None:
         """Return current audio mode."""
-        if self.coordinator.data.audio_mode:
-            return self.coordinator.data.audio_mode.mode_name
-        return None
+        if (audio_mode := self.coordinator.data.audio_mode) is None:
+            return None
+        return audio_mode.mode_name
 
     async def async_select_option(self, option: str) -> None:
         """Set audio processing mode."""
         mode_id = self._mode_name_to_id.get(option)
         if mode_id is not None:
             await self.coordinator.client.audio_mode.set(mode_id)
+            self.coordinator.async_mark_stale('audio_mode')
             await self.coordinator.async_request_refresh()
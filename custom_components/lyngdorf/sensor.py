@@ -6,17 +6,21 @@ import logging
 from typing import Any
 
 from homeassistant.components.sensor import SensorEntity
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import LyngdorfConfigEntry
-from .const import DOMAIN
 from .coordinator import LyngdorfCoordinator
 
 LOG = logging.getLogger(__name__)
 
+# video sensor directions with their icon
+VIDEO_SENSORS = (
+    ('input', 'mdi:video-input-hdmi'),
+    ('output', 'mdi:video-output-hdmi'),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -26,11 +30,10 @@ async def async_setup_entry(
     """Set up Lyngdorf sensor entities."""
     coordinator = entry.runtime_data.coordinator
 
-    entities: list[SensorEntity] = [
-        LyngdorfAudioFormatSensor(coordinator),
-        LyngdorfVideoInputSensor(coordinator),
-        LyngdorfVideoOutputSensor(coordinator),
-    ]
+    entities: list[SensorEntity] = [LyngdorfAudioFormatSensor(coordinator)]
+    entities.extend(
+        LyngdorfVideoSensor(coordinator, direction, icon) for direction, icon in VIDEO_SENSORS
+    )
 
     async_add_entities(entities, update_before_add=True)
 
@@ -47,15 +50,17 @@ class LyngdorfSensorEntity(CoordinatorEntity[LyngdorfCoordinator], SensorEntity)
     ) -> None:
         """Initialize the sensor entity."""
         super().__init__(coordinator)
-        self._attr_unique_id = f'{DOMAIN}_{coordinator.model_id}_{entity_type}'.lower()
+        self._attr_unique_id = f'{coordinator.unique_id_prefix}{entity_type}'
+        self._attr_device_info = coordinator.device_info
+        self._last_state: tuple[Any, ...] | None = None
 
-        model_name = coordinator.client._model_config['name']
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f'{DOMAIN}_{coordinator.model_id}')},
-            manufacturer='Lyngdorf',
-            model=model_name,
-            name=f'Lyngdorf {model_name}',
-        )
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if this sensor's part of the device state changed."""
+        state = (self.available, self.native_value, self.extra_state_attributes)
+        if state != self._last_state:
+            self._last_state = state
+            super()._handle_coordinator_update()
 
 
 class LyngdorfAudioFormatSensor(LyngdorfSensorEntity):
@@ -71,87 +76,50 @@ class LyngdorfAudioFormatSensor(LyngdorfSensorEntity):
     @property
     def native_value(self) -> str | None:
         """Return current audio format."""
-        if self.coordinator.data.audio_info:
-            audio = self.coordinator.data.audio_info
-            parts = []
-            if audio.format:
-                parts.append(audio.format)
-            if audio.channels:
-                parts.append(audio.channels)
-            if audio.sample_rate:
-                parts.append(audio.sample_rate)
-            return ' '.join(parts) if parts else None
-        return None
+        if (audio := self.coordinator.data.audio_info) is None:
+            return None
+        parts = [part for part in (audio.format, audio.channels, audio.sample_rate) if part]
+        return ' '.join(parts) or None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return additional audio information."""
-        if self.coordinator.data.audio_info:
-            audio = self.coordinator.data.audio_info
-            return {
-                'format': audio.format,
-                'sample_rate': audio.sample_rate,
-                'channels': audio.channels,
-                'bitrate': audio.bitrate,
-            }
-        return None
-
-
-class LyngdorfVideoInputSensor(LyngdorfSensorEntity):
-    """Sensor for current video input."""
-
-    _attr_translation_key = 'video_input'
-    _attr_icon = 'mdi:video-input-hdmi'
-
-    def __init__(self, coordinator: LyngdorfCoordinator) -> None:
-        """Initialize video input sensor."""
-        super().__init__(coordinator, 'video_input')
-
-    @property
-    def native_value(self) -> str | None:
-        """Return current video input name."""
-        if self.coordinator.data.video_info:
-            return self.coordinator.data.video_info.input_name
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return additional video input information."""
-        if self.coordinator.data.video_info:
-            video = self.coordinator.data.video_info
-            return {
-                'input_index': video.input,
-                'resolution': video.resolution,
-                'format': video.format,
-            }
-        return None
-
-
-class LyngdorfVideoOutputSensor(LyngdorfSensorEntity):
-    """Sensor for current video output."""
-
-    _attr_translation_key = 'video_output'
-    _attr_icon = 'mdi:video-output-hdmi'
-
-    def __init__(self, coordinator: LyngdorfCoordinator) -> None:
-        """Initialize video output sensor."""
-        super().__init__(coordinator, 'video_output')
+        if (audio := self.coordinator.data.audio_info) is None:
+            return None
+        return {
+            'format': audio.format,
+            'sample_rate': audio.sample_rate,
+            'channels': audio.channels,
+            'bitrate': audio.bitrate,
+        }
+
+
+class LyngdorfVideoSensor(LyngdorfSensorEntity):
+    """Sensor for the current video input or output."""
+
+    def __init__(self, coordinator: LyngdorfCoordinator, direction: str, icon: str) -> None:
+        """Initialize video sensor for a direction ('input' or 'output')."""
+        super().__init__(coordinator, f'video_{direction}')
+        self._attr_translation_key = f'video_{direction}'
+        self._attr_icon = icon
+        self._direction = direction
+        self._name_field = f'{direction}_name'
+        self._index_key = f'{direction}_index'
 
     @property
     def native_value(self) -> str | None:
-        """Return current video output name."""
-        if self.coordinator.data.video_info:
-            return self.coordinator.data.video_info.output_name
-        return None
+        """Return current video input or output name."""
+        if (video := self.coordinator.data.video_info) is None:
+            return None
+        return getattr(video, self._name_field)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return additional video output information."""
-        if self.coordinator.data.video_info:
-            video = self.coordinator.data.video_info
-            return {
-                'output_index': video.output,
-                'resolution': video.resolution,
-                'format': video.format,
-            }
-        return None
+        """Return additional video input or output information."""
+        if (video := self.coordinator.data.video_info) is None:
+            return None
+        return {
+            self._index_key: getattr(video, self._direction),
+            'resolution': video.resolution,
+            'format': video.format,
+        }
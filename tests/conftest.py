@@ -7,8 +7,10 @@ from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.lyngdorf.const import CONF_MODEL
+from custom_components.lyngdorf.const import CONF_MODEL, DOMAIN
 
 
 @pytest.fixture
@@ -26,6 +28,21 @@ def mock_config_entry_options() -> dict[str, Any]:
     return {}
 
 
+@pytest.fixture
+def preexisting_entry(
+    hass: HomeAssistant,
+    mock_config_entry_data: dict[str, Any],
+) -> MockConfigEntry:
+    """Add an entry with the unique_id the user flow gives the mock config data."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=mock_config_entry_data,
+        unique_id=f'{mock_config_entry_data[CONF_MODEL]}_{mock_config_entry_data["url"]}',
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
 @pytest.fixture
 def mock_lyngdorf_client() -> MagicMock:
     """Create a mock Lyngdorf client."""
@@ -94,6 +111,18 @@ def mock_lyngdorf_client() -> MagicMock:
     client.trim.get_lfe = AsyncMock(return_value=0.0)
     client.trim.get_surrounds = AsyncMock(return_value=0.0)
     client.trim.get_height = AsyncMock(return_value=0.0)
+
+    async def _get_all_trims() -> dict[str, float | None]:
+        return {
+            'bass': await client.trim.get_bass(),
+            'treble': await client.trim.get_treble(),
+            'center': await client.trim.get_center(),
+            'lfe': await client.trim.get_lfe(),
+            'surrounds': await client.trim.get_surrounds(),
+            'height': await client.trim.get_height(),
+        }
+
+    client.trim.get_all = AsyncMock(side_effect=_get_all_trims)
     client.trim.set_bass = AsyncMock()
     client.trim.set_treble = AsyncMock()
     client.trim.set_center = AsyncMock()
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, patch
 
+import pytest
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.lyngdorf.const import CONF_MODEL, DOMAIN
 
@@ -47,40 +49,26 @@ async def test_user_form_success(
     }
 
 
+@pytest.mark.parametrize(
+    ('ping_result', 'connect_error'),
+    [
+        pytest.param(False, None, id='ping_failed'),
+        pytest.param(True, ConnectionError('Connection refused'), id='connection_error'),
+    ],
+)
 async def test_user_form_cannot_connect(
     hass: HomeAssistant,
     mock_lyngdorf_client: AsyncMock,
+    ping_result: bool,
+    connect_error: Exception | None,
 ) -> None:
-    """Test handling connection failure."""
-    mock_lyngdorf_client.device.ping.return_value = False
+    """Test handling a device that does not answer or refuses the connection."""
+    mock_lyngdorf_client.device.ping.return_value = ping_result
 
     with patch(
         'custom_components.lyngdorf.config_flow.async_get_lyngdorf',
         return_value=mock_lyngdorf_client,
-    ):
-        result = await hass.config_entries.flow.async_init(
-            DOMAIN, context={'source': config_entries.SOURCE_USER}
-        )
-
-        result = await hass.config_entries.flow.async_configure(
-            result['flow_id'],
-            {
-                CONF_MODEL: 'mp60',
-                'url': 'socket://192.168.1.100:84',
-            },
-        )
-
-    assert result['type'] == FlowResultType.FORM
-    assert result['errors'] == {'base': 'cannot_connect'}
-
-
-async def test_user_form_connection_error(
-    hass: HomeAssistant,
-) -> None:
-    """Test handling connection error exception."""
-    with patch(
-        'custom_components.lyngdorf.config_flow.async_get_lyngdorf',
-        side_effect=ConnectionError('Connection refused'),
+        side_effect=connect_error,
     ):
         result = await hass.config_entries.flow.async_init(
             DOMAIN, context={'source': config_entries.SOURCE_USER}
@@ -100,26 +88,11 @@ async def test_user_form_connection_error(
 
 async def test_user_form_already_configured(
     hass: HomeAssistant,
+    preexisting_entry: MockConfigEntry,
     mock_config_flow_lyngdorf: AsyncMock,
     mock_lyngdorf_client: AsyncMock,
 ) -> None:
     """Test we handle already configured."""
-    # create first entry
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={'source': config_entries.SOURCE_USER}
-    )
-
-    result = await hass.config_entries.flow.async_configure(
-        result['flow_id'],
-        {
-            CONF_MODEL: 'mp60',
-            'url': 'socket://192.168.1.100:84',
-        },
-    )
-
-    assert result['type'] == FlowResultType.CREATE_ENTRY
-
-    # try to create duplicate entry
     result = await hass.config_entries.flow.async_init(
         DOMAIN, context={'source': config_entries.SOURCE_USER}
     )
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 from unittest.mock import MagicMock
 
@@ -10,9 +11,16 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
 from custom_components.lyngdorf.coordinator import LyngdorfCoordinator
+from custom_components.lyngdorf.pylyngdorf.protocol import StateUpdate
 from custom_components.lyngdorf.pylyngdorf.state import DeviceState
 
 
+async def _async_update(hass: HomeAssistant, client: MagicMock) -> DeviceState:
+    """Create an MP-60 coordinator for the mock client and run one update."""
+    coordinator = LyngdorfCoordinator(hass, client, 'mp60')
+    return await coordinator._async_update_data()
+
+
 async def test_coordinator_init(
     hass: HomeAssistant,
     mock_lyngdorf_client: MagicMock,
@@ -36,14 +44,7 @@ async def test_coordinator_update_success(
     mock_lyngdorf_client: MagicMock,
 ) -> None:
     """Test successful coordinator update."""
-    coordinator = LyngdorfCoordinator(
-        hass,
-        mock_lyngdorf_client,
-        'mp60',
-    )
-
-    # perform update
-    data = await coordinator._async_update_data()
+    data = await _async_update(hass, mock_lyngdorf_client)
 
     assert data.connected is True
     assert data.power.main is True
@@ -61,13 +62,7 @@ async def test_coordinator_update_device_off(
     """Test coordinator update when device is off."""
     mock_lyngdorf_client.power.get.return_value = False
 
-    coordinator = LyngdorfCoordinator(
-        hass,
-        mock_lyngdorf_client,
-        'mp60',
-    )
-
-    data = await coordinator._async_update_data()
+    data = await _async_update(hass, mock_lyngdorf_client)
 
     assert data.connected is True
     assert data.power.main is False
@@ -89,13 +84,7 @@ async def test_coordinator_update_zone2(
         'name': 'Optical 1',
     }
 
-    coordinator = LyngdorfCoordinator(
-        hass,
-        mock_lyngdorf_client,
-        'mp60',
-    )
-
-    data = await coordinator._async_update_data()
+    data = await _async_update(hass, mock_lyngdorf_client)
 
     assert data.power.zone2 is True
     assert data.volume_zone2.level == -35.0
@@ -109,13 +98,7 @@ async def test_coordinator_update_roomperfect(
     mock_lyngdorf_client: MagicMock,
 ) -> None:
     """Test coordinator update for RoomPerfect state."""
-    coordinator = LyngdorfCoordinator(
-        hass,
-        mock_lyngdorf_client,
-        'mp60',
-    )
-
-    data = await coordinator._async_update_data()
+    data = await _async_update(hass, mock_lyngdorf_client)
 
     assert data.roomperfect is not None
     assert data.roomperfect.position == 1
@@ -132,31 +115,209 @@ async def test_coordinator_update_trim(
     mock_lyngdorf_client.trim.get_bass.return_value = 2.0
     mock_lyngdorf_client.trim.get_treble.return_value = -1.5
 
+    data = await _async_update(hass, mock_lyngdorf_client)
+
+    assert data.trim is not None
+    assert data.trim.bass == 2.0
+    assert data.trim.treble == -1.5
+
+
+async def test_coordinator_update_failure(
+    hass: HomeAssistant,
+    mock_lyngdorf_client: MagicMock,
+) -> None:
+    """Test coordinator update failure."""
+    mock_lyngdorf_client.power.get.side_effect = Exception('Connection lost')
+
+    with pytest.raises(UpdateFailed) as exc_info:
+        await _async_update(hass, mock_lyngdorf_client)
+    assert 'Error communicating with device' in str(exc_info.value)
+
+
+async def test_coordinator_update_partial_failure(
+    hass: HomeAssistant,
+    mock_lyngdorf_client: MagicMock,
+) -> None:
+    """Test a single failed query does not abort the whole update."""
+    mock_lyngdorf_client.mute.get.side_effect = Exception('Timeout')
+
+    data = await _async_update(hass, mock_lyngdorf_client)
+
+    assert data.connected is True
+    assert data.volume_main.level == -30.0
+    assert data.volume_main.muted is False
+    assert data.source_main is not None
+
+
+async def test_coordinator_push_update(
+    hass: HomeAssistant,
+    mock_lyngdorf_client: MagicMock,
+) -> None:
+    """Test pushed state updates are applied without querying the device."""
     coordinator = LyngdorfCoordinator(
         hass,
         mock_lyngdorf_client,
         'mp60',
     )
+    on_state_update = mock_lyngdorf_client.register_state_callback.call_args[0][0]
+
+    on_state_update('volume', StateUpdate('!VOL(-255)', ('-255',)))
+    on_state_update('source', StateUpdate('!SRC(3)"Optical"', ('3', 'Optical')))
+
+    assert coordinator.data.volume_main.level == -25.5
+    assert coordinator.data.source_main is not None
+    assert coordinator.data.source_main.index == 3
+    mock_lyngdorf_client.volume.get.assert_not_called()
+    mock_lyngdorf_client.source.get.assert_not_called()
+
+    await coordinator.async_shutdown()
+
+
+async def test_coordinator_update_query_timeout(
+    hass: HomeAssistant,
+    mock_lyngdorf_client: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a stuck query is bounded and leaves other fields populated."""
+    monkeypatch.setattr('custom_components.lyngdorf.coordinator.QUERY_TIMEOUT', 0.01)
 
-    data = await coordinator._async_update_data()
+    async def _stuck() -> None:
+        await asyncio.sleep(1)
 
+    mock_lyngdorf_client.lipsync.get.side_effect = _stuck
+
+    data = await _async_update(hass, mock_lyngdorf_client)
+
+    assert data.lipsync == 0
+    assert data.volume_main.level == -30.0
     assert data.trim is not None
-    assert data.trim.bass == 2.0
-    assert data.trim.treble == -1.5
 
 
-async def test_coordinator_update_failure(
+async def test_coordinator_skips_cached_groups(
     hass: HomeAssistant,
     mock_lyngdorf_client: MagicMock,
 ) -> None:
-    """Test coordinator update failure."""
-    mock_lyngdorf_client.power.get.side_effect = Exception('Connection lost')
+    """Test slow-changing state is only re-read once marked stale."""
+    coordinator = LyngdorfCoordinator(
+        hass,
+        mock_lyngdorf_client,
+        'mp60',
+    )
+
+    await coordinator.async_refresh()
+    mock_lyngdorf_client.trim.get_bass.return_value = 3.0
+    await coordinator.async_refresh()
+
+    assert mock_lyngdorf_client.trim.get_bass.call_count == 1
+    assert coordinator.data.trim is not None
+    assert coordinator.data.trim.bass == 0.0
+    assert coordinator.data.roomperfect is not None
+
+    coordinator.async_mark_stale('trim')
+    await coordinator.async_refresh()
+
+    assert mock_lyngdorf_client.trim.get_bass.call_count == 2
+    assert coordinator.data.trim.bass == 3.0
+
+    await coordinator.async_shutdown()
+
+
+async def test_coordinator_skips_poll_after_push(
+    hass: HomeAssistant,
+    mock_lyngdorf_client: MagicMock,
+) -> None:
+    """Test a poll is skipped while pushed state is fresh."""
+    coordinator = LyngdorfCoordinator(
+        hass,
+        mock_lyngdorf_client,
+        'mp60',
+    )
+    on_state_update = mock_lyngdorf_client.register_state_callback.call_args[0][0]
+
+    await coordinator.async_refresh()
+    on_state_update('volume', StateUpdate('!VOL(-255)', ('-255',)))
+    await coordinator.async_refresh()
+
+    assert mock_lyngdorf_client.power.get.call_count == 1
+    assert coordinator.data.volume_main.level == -25.5
+
+    # a push that can't be applied in place forces the next poll
+    on_state_update('power', StateUpdate('!POWER(1)', ('1',)))
+    await coordinator.async_refresh()
+
+    assert mock_lyngdorf_client.power.get.call_count == 2
 
+    await coordinator.async_shutdown()
+
+
+async def test_coordinator_skips_queries_when_power_unchanged(
+    hass: HomeAssistant,
+    mock_lyngdorf_client: MagicMock,
+) -> None:
+    """Test only power is polled while it is unchanged and nothing is stale."""
+    coordinator = LyngdorfCoordinator(
+        hass,
+        mock_lyngdorf_client,
+        'mp60',
+    )
+
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+
+    assert mock_lyngdorf_client.power.get.call_count == 2
+    assert mock_lyngdorf_client.volume.get.call_count == 1
+    assert coordinator.data.volume_main.level == -30.0
+
+    # a power transition requires a full refresh again
+    mock_lyngdorf_client.zone_2.power.get.return_value = True
+    await coordinator.async_refresh()
+
+    assert mock_lyngdorf_client.volume.get.call_count == 2
+    assert mock_lyngdorf_client.zone_2.volume.get.call_count == 1
+    assert coordinator.data.power.zone2 is True
+
+    await coordinator.async_shutdown()
+
+
+async def test_coordinator_device_refresh_after_push(
+    hass: HomeAssistant,
+    mock_lyngdorf_client: MagicMock,
+) -> None:
+    """Test a requested device refresh re-reads state despite a fresh push."""
     coordinator = LyngdorfCoordinator(
         hass,
         mock_lyngdorf_client,
         'mp60',
     )
+    on_state_update = mock_lyngdorf_client.register_state_callback.call_args[0][0]
+
+    await coordinator.async_refresh()
+    on_state_update('mute', StateUpdate('!MUTEOFF', ('OFF',)))
+
+    # e.g. a volume step, whose reply is not dispatched as a push
+    mock_lyngdorf_client.volume.get.return_value = -29.5
+    await coordinator.async_request_device_refresh()
+
+    assert mock_lyngdorf_client.volume.get.call_count == 2
+    assert coordinator.data.volume_main.level == -29.5
 
-    with pytest.raises(UpdateFailed, match='Error communicating with device'):
+    await coordinator.async_shutdown()
+
+
+async def test_coordinator_caches_lipsync_range(
+    hass: HomeAssistant,
+    mock_lyngdorf_client: MagicMock,
+) -> None:
+    """Test lipsync range is queried once and re-read after a connection error."""
+    coordinator = LyngdorfCoordinator(hass, mock_lyngdorf_client, 'mp60')
+
+    assert await coordinator.async_get_lipsync_range() == {'min': 0, 'max': 500}
+    assert await coordinator.async_get_lipsync_range() == {'min': 0, 'max': 500}
+    assert mock_lyngdorf_client.lipsync.get_range.call_count == 1
+
+    mock_lyngdorf_client.power.get.side_effect = OSError('Port closed')
+    with pytest.raises(UpdateFailed):
         await coordinator._async_update_data()
+
+    await coordinator.async_get_lipsync_range()
+    assert mock_lyngdorf_client.lipsync.get_range.call_count == 2
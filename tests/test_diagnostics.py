@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import timedelta
+from typing import Any
 from unittest.mock import MagicMock
 
 from homeassistant.core import HomeAssistant
@@ -13,15 +14,13 @@ from custom_components.lyngdorf.coordinator import LyngdorfCoordinator
 from custom_components.lyngdorf.diagnostics import async_get_config_entry_diagnostics
 
 
-async def test_diagnostics(
-    hass: HomeAssistant,
-    mock_lyngdorf_client: MagicMock,
-) -> None:
-    """Test diagnostics output."""
-    # create coordinator
+async def _get_diagnostics(
+    hass: HomeAssistant, client: MagicMock, options: dict[str, Any]
+) -> dict[str, Any]:
+    """Return diagnostics for an MP-60 entry with the given options."""
     coordinator = LyngdorfCoordinator(
         hass,
-        mock_lyngdorf_client,
+        client,
         'mp60',
         update_interval=timedelta(seconds=30),
     )
@@ -37,16 +36,24 @@ async def test_diagnostics(
         CONF_MODEL: 'mp60',
         'url': 'socket://192.168.1.100:84',
     }
-    entry.options = {}
+    entry.options = options
 
     # create runtime data
     entry.runtime_data = LyngdorfData(
-        client=mock_lyngdorf_client,
+        client=client,
         config=entry.data,
         coordinator=coordinator,
     )
 
-    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+    return await async_get_config_entry_diagnostics(hass, entry)
+
+
+async def test_diagnostics(
+    hass: HomeAssistant,
+    mock_lyngdorf_client: MagicMock,
+) -> None:
+    """Test diagnostics output."""
+    diagnostics = await _get_diagnostics(hass, mock_lyngdorf_client, {})
 
     # verify structure
     assert 'config_entry' in diagnostics
@@ -71,34 +78,9 @@ async def test_diagnostics_with_sources(
     mock_lyngdorf_client: MagicMock,
 ) -> None:
     """Test diagnostics with custom sources configured."""
-    coordinator = LyngdorfCoordinator(
-        hass,
-        mock_lyngdorf_client,
-        'mp60',
-        update_interval=timedelta(seconds=30),
-    )
-    await coordinator._async_update_data()
-
-    entry = MagicMock(spec=LyngdorfConfigEntry)
-    entry.entry_id = 'test_entry_id'
-    entry.version = 1
-    entry.domain = DOMAIN
-    entry.title = 'Lyngdorf MP-60'
-    entry.data = {
-        CONF_MODEL: 'mp60',
-        'url': 'socket://192.168.1.100:84',
-    }
-    entry.options = {
-        'sources': {1: 'My TV', 3: 'Turntable'},
-    }
-
-    entry.runtime_data = LyngdorfData(
-        client=mock_lyngdorf_client,
-        config=entry.data,
-        coordinator=coordinator,
+    diagnostics = await _get_diagnostics(
+        hass, mock_lyngdorf_client, {'sources': {1: 'My TV', 3: 'Turntable'}}
     )
 
-    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
-
     # verify sources count is included but not the names
     assert diagnostics['config_entry']['sources_configured'] == 2
@@ -107,6 +107,21 @@ TEST_MODEL_IDS = [
     'tdai-1120',
 ]
 
+# every (model, type, unique_id) combination, written out from the documented formats
+SENSOR_GOLDEN: tuple[tuple[str, str, str], ...] = tuple(
+    (m, t, f'{DOMAIN}_{m}_{t}'.lower()) for m in TEST_MODEL_IDS for t in SENSOR_ENTITY_TYPES
+)
+
+NUMBER_GOLDEN: tuple[tuple[str, str, str], ...] = tuple(
+    (m, t, f'{DOMAIN}_{m}_{t}'.lower()) for m in TEST_MODEL_IDS for t in NUMBER_ENTITY_TYPES
+)
+
+MEDIA_PLAYER_GOLDEN: tuple[tuple[str, str, str], ...] = tuple(
+    (m, z, f'{DOMAIN}_{m.lower().replace(" ", "_")}{"_zone2" if z == "zone2" else ""}')
+    for m in TEST_MODEL_IDS
+    for z in ('main', 'zone2')
+)
+
 
 # -----------------------------------------------------------------------------
 # Sensor entity unique_id tests
@@ -116,16 +131,10 @@ TEST_MODEL_IDS = [
 class TestSensorUniqueIdStability:
     """Test sensor entity unique_id stability."""
 
-    @pytest.mark.parametrize('model_id', TEST_MODEL_IDS)
-    @pytest.mark.parametrize('entity_type', SENSOR_ENTITY_TYPES)
-    def test_sensor_unique_id_format(self, model_id: str, entity_type: str) -> None:
-        """Verify sensor unique_id format remains stable."""
-        unique_id = generate_sensor_unique_id(model_id, entity_type)
-
-        # format requirements
-        assert unique_id.islower(), f'unique_id must be lowercase: {unique_id}'
-        assert unique_id.startswith(f'{DOMAIN}_'), f'must start with domain: {unique_id}'
-        assert entity_type in unique_id, f'must contain entity_type: {unique_id}'
+    def test_sensor_unique_id_format(self) -> None:
+        """Verify sensor unique_id format remains stable for every model and type."""
+        got = tuple((m, t, generate_sensor_unique_id(m, t)) for m, t, _ in SENSOR_GOLDEN)
+        assert got == SENSOR_GOLDEN
 
     def test_sensor_golden_examples(self) -> None:
         """Verify specific golden examples for sensor entities.
@@ -154,16 +163,10 @@ class TestSensorUniqueIdStability:
 class TestNumberUniqueIdStability:
     """Test number entity unique_id stability."""
 
-    @pytest.mark.parametrize('model_id', TEST_MODEL_IDS)
-    @pytest.mark.parametrize('entity_type', NUMBER_ENTITY_TYPES)
-    def test_number_unique_id_format(self, model_id: str, entity_type: str) -> None:
-        """Verify number unique_id format remains stable."""
-        unique_id = generate_number_unique_id(model_id, entity_type)
-
-        # format requirements
-        assert unique_id.islower(), f'unique_id must be lowercase: {unique_id}'
-        assert unique_id.startswith(f'{DOMAIN}_'), f'must start with domain: {unique_id}'
-        assert entity_type in unique_id, f'must contain entity_type: {unique_id}'
+    def test_number_unique_id_format(self) -> None:
+        """Verify number unique_id format remains stable for every model and type."""
+        got = tuple((m, t, generate_number_unique_id(m, t)) for m, t, _ in NUMBER_GOLDEN)
+        assert got == NUMBER_GOLDEN
 
     def test_number_golden_examples(self) -> None:
         """Verify specific golden examples for number entities.
@@ -192,19 +195,12 @@ class TestNumberUniqueIdStability:
 class TestMediaPlayerUniqueIdStability:
     """Test media player entity unique_id stability."""
 
-    @pytest.mark.parametrize('model_id', TEST_MODEL_IDS)
-    @pytest.mark.parametrize('zone', ['main', 'zone2'])
-    def test_media_player_unique_id_format(self, model_id: str, zone: str) -> None:
-        """Verify media player unique_id format remains stable."""
-        unique_id = generate_media_player_unique_id(model_id, zone)
-
-        # format requirements
-        assert unique_id.islower(), f'unique_id must be lowercase: {unique_id}'
-        assert unique_id.startswith(f'{DOMAIN}_'), f'must start with domain: {unique_id}'
-        assert ' ' not in unique_id, f'must not contain spaces: {unique_id}'
-
-        if zone == 'zone2':
-            assert unique_id.endswith('_zone2'), f'zone2 must end with _zone2: {unique_id}'
+    def test_media_player_unique_id_format(self) -> None:
+        """Verify media player unique_id format remains stable for every model and zone."""
+        got = tuple(
+            (m, z, generate_media_player_unique_id(m, z)) for m, z, _ in MEDIA_PLAYER_GOLDEN
+        )
+        assert got == MEDIA_PLAYER_GOLDEN
 
     def test_media_player_golden_examples(self) -> None:
         """Verify specific golden examples for media player entities.
@@ -5,7 +5,11 @@ from __future__ import annotations
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
+
+from custom_components.lyngdorf import async_setup_entry, async_unload_entry
 
 
 async def test_setup_entry(
@@ -19,13 +23,12 @@ async def test_setup_entry(
     entry.entry_id = 'test_entry'
     entry.data = mock_config_entry_data
     entry.options = {}
+    entry.state = ConfigEntryState.SETUP_IN_PROGRESS
     entry.add_update_listener = MagicMock(return_value=MagicMock())
     entry.async_on_unload = MagicMock()
 
     # mock platform setup
     with patch.object(hass.config_entries, 'async_forward_entry_setups', new_callable=AsyncMock):
-        from custom_components.lyngdorf import async_setup_entry
-
         result = await async_setup_entry(hass, entry)
 
     assert result is True
@@ -38,21 +41,46 @@ async def test_setup_entry_connection_failed(
     mock_config_entry_data: dict,
 ) -> None:
     """Test setup failure when connection fails."""
+    # setup only reads entry.data before connecting
+    entry = MagicMock()
+    entry.data = mock_config_entry_data
+
+    with (
+        patch(
+            'custom_components.lyngdorf.pylyngdorf.async_get_lyngdorf',
+            side_effect=Exception('Connection failed'),
+        ),
+        pytest.raises(ConfigEntryNotReady),
+    ):
+        await async_setup_entry(hass, entry)
+
+
+async def test_setup_entry_first_refresh_failed(
+    hass: HomeAssistant,
+    mock_async_get_lyngdorf: AsyncMock,
+    mock_lyngdorf_client: MagicMock,
+    mock_config_entry_data: dict,
+) -> None:
+    """Test platforms are not forwarded when the first refresh fails."""
+    mock_lyngdorf_client.power.get.side_effect = OSError('Connection lost')
+
     entry = MagicMock()
     entry.entry_id = 'test_entry'
     entry.data = mock_config_entry_data
     entry.options = {}
+    entry.state = ConfigEntryState.SETUP_IN_PROGRESS
+    entry.add_update_listener = MagicMock(return_value=MagicMock())
+    entry.async_on_unload = MagicMock()
 
-    with patch(
-        'custom_components.lyngdorf.async_get_lyngdorf',
-        side_effect=Exception('Connection failed'),
+    with (
+        patch.object(
+            hass.config_entries, 'async_forward_entry_setups', new_callable=AsyncMock
+        ) as mock_forward,
+        pytest.raises(ConfigEntryNotReady),
     ):
-        from homeassistant.exceptions import ConfigEntryNotReady
-
-        from custom_components.lyngdorf import async_setup_entry
+        await async_setup_entry(hass, entry)
 
-        with pytest.raises(ConfigEntryNotReady):
-            await async_setup_entry(hass, entry)
+    mock_forward.assert_not_called()
 
 
 async def test_unload_entry(
@@ -66,20 +94,17 @@ async def test_unload_entry(
     entry.entry_id = 'test_entry'
     entry.data = mock_config_entry_data
     entry.options = {}
+    entry.state = ConfigEntryState.SETUP_IN_PROGRESS
     entry.add_update_listener = MagicMock(return_value=MagicMock())
     entry.async_on_unload = MagicMock()
 
     with patch.object(hass.config_entries, 'async_forward_entry_setups', new_callable=AsyncMock):
-        from custom_components.lyngdorf import async_setup_entry
-
         await async_setup_entry(hass, entry)
 
     with patch.object(
         hass.config_entries, 'async_unload_platforms', new_callable=AsyncMock
     ) as mock_unload:
         mock_unload.return_value = True
-        from custom_components.lyngdorf import async_unload_entry
-
         result = await async_unload_entry(hass, entry)
 
     assert result is True
@@ -0,0 +1,289 @@
+"""Tests for Lyngdorf protocol and response parsing."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.lyngdorf.coordinator import LyngdorfCoordinator
+from custom_components.lyngdorf.pylyngdorf import (
+    LyngdorfAsync,
+    _parse_named,
+    _parse_named_list,
+    _parse_value,
+)
+from custom_components.lyngdorf.pylyngdorf.models import get_model_config
+from custom_components.lyngdorf.pylyngdorf.protocol import (
+    StateUpdate,
+    async_get_protocol,
+    parse_state_update,
+)
+
+
+async def _create_protocol() -> Any:
+    """Create a protocol connected to a mock transport."""
+
+    async def create_serial_connection(loop, factory, port, **kwargs):
+        protocol = factory()
+        transport = MagicMock()
+        protocol.connection_made(transport)
+        return transport, protocol
+
+    with patch('serial_asyncio_fast.create_serial_connection', create_serial_connection):
+        return await async_get_protocol(
+            'socket://192.168.1.100:84', 0.0, '\r', {'timeout': 0.1}, asyncio.get_running_loop()
+        )
+
+
+def _answer(protocol: Any, replies: dict[bytes, tuple[bytes, ...]]) -> None:
+    """Make the mock transport answer each request with its chunks of reply data."""
+    loop = asyncio.get_running_loop()
+
+    def reply(request: bytes) -> None:
+        for chunk in replies[request]:
+            loop.call_soon(protocol.data_received, chunk)
+
+    protocol._transport.serial.write.side_effect = reply
+
+
+@pytest.mark.parametrize(
+    ('message', 'state_type', 'groups'),
+    [
+        ('!POWER(1)', 'power', ('1',)),
+        ('!POWERZONE2(0)', 'power_zone2', ('0',)),
+        ('!VOL(-455)', 'volume', ('-455',)),
+        ('!ZVOL(-300)', 'volume_zone2', ('-300',)),
+        ('!MUTEON', 'mute', ('ON',)),
+        ('!ZMUTEOFF', 'mute_zone2', ('OFF',)),
+        ('!SRC(1)"HDMI"', 'source', ('1', 'HDMI')),
+        ('!ZSRC(3)"SPDIF 1 (Optical)"', 'source_zone2', ('3', 'SPDIF 1 (Optical)')),
+        ('!RPFOC(2)"Focus 2"', 'roomperfect_position', ('2', 'Focus 2')),
+        ('!RPVOI(0)""', 'roomperfect_voicing', ('0', '')),
+        ('!AUDMODE(4)"Dolby Upmix"', 'audio_mode', ('4', 'Dolby Upmix')),
+        ('!LIPSYNC(25)', 'lipsync', ('25',)),
+        ('!LOUDNESS(1)', 'loudness', ('1',)),
+    ],
+)
+def test_parse_state_update(message: str, state_type: str, groups: tuple[str, ...]) -> None:
+    """Test each state update type is recognized with its own groups."""
+    assert parse_state_update(message) == (state_type, StateUpdate(message, groups))
+
+
+def test_parse_state_update_fallback() -> None:
+    """Test updates not at the start of the message are still found."""
+    assert parse_state_update('xx!VOL(-455)') == (
+        'volume',
+        StateUpdate('xx!VOL(-455)', ('-455',)),
+    )
+
+
+@pytest.mark.parametrize(
+    'message', ['!VERB(1)', 'OK', '!VOL(abc)', '!POWER(-1)', '!SRC(1)"HDMI', '!MUTE', '']
+)
+def test_parse_state_update_unknown(message: str) -> None:
+    """Test messages that are not state updates are ignored."""
+    assert parse_state_update(message) is None
+
+
+@pytest.mark.parametrize(
+    'message', ['!VOL(-255', '!LIPSYNC(120', '!POWER(1', '!SRC(1', '!RPFOC(2"Focus 2"']
+)
+def test_parse_state_update_truncated(message: str) -> None:
+    """Test updates cut off before the closing parenthesis are not published."""
+    assert parse_state_update(message) is None
+
+
+@pytest.mark.parametrize(
+    ('response', 'tag', 'value'),
+    [
+        ('!VOL(-455)', 'VOL', '-455'),
+        ('!LIPSYNCRANGE(0,500)', 'LIPSYNCRANGE', '0,500'),
+        ('!TRIMBASS(-15)', 'TRIMBASS', '-15'),
+        ('!MAXVOL(240)', 'VOL', None),
+        ('!MUTEON', 'MUTE', None),
+        (None, 'VOL', None),
+    ],
+)
+def test_parse_value(response: str | None, tag: str, value: str | None) -> None:
+    """Test values are only taken from replies with the expected tag."""
+    assert _parse_value(response, tag) == value
+
+
+def test_parse_named() -> None:
+    """Test index and name are parsed from named replies."""
+    assert _parse_named('!SRC(3)"SPDIF 1 (Optical)"', 'SRC') == (3, 'SPDIF 1 (Optical)')
+    assert _parse_named('!SRC(3)', 'SRC') == (3, '')
+    assert _parse_named('!SRC(x)"HDMI"', 'SRC') is None
+    assert _parse_named_list(
+        '!RPFOCS(2)\r!RPFOC(1)"Focus 1"\r!RPFOC(2)"Focus 2"\r!RPFOC(3)', 'RPFOC'
+    ) == {1: 'Focus 1', 2: 'Focus 2'}
+
+
+async def test_send_reads_reply_across_chunks() -> None:
+    """Test a reply split over several reads, after an echo line, is returned whole."""
+    protocol = await _create_protocol()
+    loop = asyncio.get_running_loop()
+
+    def reply(request: bytes) -> None:
+        for chunk in (b'#!VOL?\r', b'!VOL(-4', b'55)\r'):
+            loop.call_soon(protocol.data_received, chunk)
+
+    protocol._transport.serial.write.side_effect = reply
+
+    assert await protocol.send(b'!VOL?\r') == '!VOL(-455)'
+
+
+async def test_data_received_dispatches_pushes_only() -> None:
+    """Test pushed state updates reach callbacks while echoes are dropped."""
+    protocol = await _create_protocol()
+    callback = MagicMock()
+    protocol.register_general_callback(callback)
+
+    protocol.data_received(b'#!VOL(-300)\r')
+    protocol.data_received(b'\r\n')
+    callback.assert_not_called()
+
+    protocol.data_received(b'!VOL(-300)\r')
+    callback.assert_called_once()
+    assert callback.call_args[0][0] == 'volume'
+
+
+async def test_async_client_caches_static_queries() -> None:
+    """Test static query replies are reused until a command changes state."""
+    protocol = MagicMock()
+    protocol.send = AsyncMock(return_value='!MAXVOL(120)')
+    client = LyngdorfAsync('mp60', get_model_config('mp60'), protocol)
+
+    assert await client.volume.get_max() == 12.0
+    assert await client.volume.get_max() == 12.0
+    assert protocol.send.await_count == 1
+
+    await client.volume.set_max(10.0)
+    await client.volume.get_max()
+    assert protocol.send.await_count == 3
+
+    protocol.send.return_value = '!VOL(-300)'
+    await client.volume.get()
+    await client.volume.get()
+    assert protocol.send.await_count == 5
+
+
+async def test_async_client_coalesces_concurrent_queries() -> None:
+    """Test identical queries in flight together share a single round trip."""
+    reply = asyncio.get_running_loop().create_future()
+
+    async def send(request: bytes) -> str:
+        return await reply
+
+    protocol = MagicMock()
+    protocol.send = AsyncMock(side_effect=send)
+    client = LyngdorfAsync('mp60', get_model_config('mp60'), protocol)
+
+    tasks = [asyncio.create_task(client.power.get()) for _ in range(3)]
+    await asyncio.sleep(0)
+    reply.set_result('!POWER(1)')
+
+    assert await asyncio.gather(*tasks) == [True, True, True]
+    assert protocol.send.await_count == 1
+    assert not client._inflight
+
+
+async def test_query_reply_is_not_dispatched(hass: HomeAssistant) -> None:
+    """Test replies to our own queries never reach the push callbacks."""
+    protocol = await _create_protocol()
+    client = LyngdorfAsync('mp60', get_model_config('mp60'), protocol)
+    coordinator = LyngdorfCoordinator(hass, client, 'mp60')
+    power_callback = MagicMock()
+    protocol.register_state_callback('power', power_callback)
+    _answer(protocol, {b'!POWER?\r': (b'!POWER(1)\r',)})
+
+    with patch.object(coordinator._push_refresh_debouncer, 'async_schedule_call') as mock_schedule:
+        assert await client.power.get() is True
+
+    power_callback.assert_not_called()
+    mock_schedule.assert_not_called()
+    assert coordinator._last_push is None
+
+
+async def test_send_collects_listing_and_dispatches_extra_lines() -> None:
+    """Test listing lines belong to the reply while other status lines are pushes."""
+    protocol = await _create_protocol()
+    callback = MagicMock()
+    protocol.register_general_callback(callback)
+    _answer(
+        protocol,
+        {
+            b'!RPFOCS?\r': (
+                b'#!RPFOCS?\r!RPFOCS(2)\r!RPFOC(1)"Focus 1"\r',
+                b'!RPFOC(2)"Focus 2"\r!VOL(-300)\r',
+            )
+        },
+    )
+
+    response = await protocol.send(b'!RPFOCS?\r')
+
+    assert _parse_named_list(response, 'RPFOC') == {1: 'Focus 1', 2: 'Focus 2'}
+    callback.assert_called_once()
+    assert callback.call_args[0][0] == 'volume'
+
+
+async def test_refresh_skips_zone_queries_against_protocol(hass: HomeAssistant) -> None:
+    """Test an unchanged power state skips the zone queries with real device replies."""
+    protocol = await _create_protocol()
+    client = LyngdorfAsync('mp60', get_model_config('mp60'), protocol)
+    coordinator = LyngdorfCoordinator(hass, client, 'mp60')
+    replies = {
+        '!POWER?': '!POWER(1)',
+        '!POWERZONE2?': '!POWERZONE2(0)',
+        '!VOL?': '!VOL(-300)',
+        '!MUTE?': '!MUTEOFF',
+        '!SRC?': '!SRC(1)"HDMI"',
+        '!RPFOC?': '!RPFOC(1)"Focus 1"',
+        '!RPVOI?': '!RPVOI(0)"Neutral"',
+        '!AUDMODE?': '!AUDMODE(0)"Stereo"',
+        '!LIPSYNC?': '!LIPSYNC(0)',
+        '!LOUDNESS?': '!LOUDNESS(0)',
+    }
+    for channel in ('BASS', 'TREB', 'CENTER', 'LFE', 'SURRS', 'HEIGHT'):
+        replies[f'!TRIM{channel}?'] = f'!TRIM{channel}(0)'
+    _answer(protocol, {f'{q}\r'.encode(): (f'{r}\r'.encode(),) for q, r in replies.items()})
+    write = protocol._transport.serial.write
+
+    await coordinator.async_refresh()
+    assert write.call_count == len(replies)
+    assert coordinator.data.volume_main.level == -30.0
+
+    write.reset_mock()
+    await coordinator.async_refresh()
+
+    assert [call.args[0] for call in write.call_args_list] == [b'!POWER?\r', b'!POWERZONE2?\r']
+    assert coordinator.data.volume_main.level == -30.0
+
+
+async def test_async_client_coalesced_query_survives_cancelled_caller() -> None:
+    """Test cancelling the caller that sent a query doesn't cancel callers joining it."""
+    reply = asyncio.get_running_loop().create_future()
+
+    async def send(request: bytes) -> str:
+        return await reply
+
+    protocol = MagicMock()
+    protocol.send = AsyncMock(side_effect=send)
+    client = LyngdorfAsync('mp60', get_model_config('mp60'), protocol)
+
+    leader = asyncio.create_task(client.power.get())
+    await asyncio.sleep(0)
+    joiner = asyncio.create_task(client.power.get())
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    await asyncio.sleep(0)
+    reply.set_result('!POWER(1)')
+
+    assert await joiner is True
+    assert leader.cancelled()
+    assert protocol.send.await_count == 1